@@ -0,0 +1,113 @@
+# ---------------------------------------------------------------
+# Gestionnaire d’assets : chargement unique + cache disque pré-redimensionné
+# ---------------------------------------------------------------
+# Deux niveaux de cache :
+#   1) en mémoire : chaque (fichier, taille, colorkey) n’est chargé qu’une fois par
+#      processus ; un "R" pour rejouer ne relit plus rien sur le disque ;
+#   2) sur disque : les pixels déjà redimensionnés sont sauvegardés en brut (RGB),
+#      indexés par l’empreinte SHA-1 du fichier source et la taille demandée.
+#      Au démarrage suivant, on évite le décodage JPEG et le smoothscale.
+#      Si l’image source change, son empreinte change : l’ancien cache est ignoré.
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+import pygame
+
+RED = (255, 0, 0)
+_HEADER = struct.Struct("<4sII")      # magie, largeur, hauteur
+_MAGIC = b"SIAC"
+
+
+class AssetManager:
+    """Charge les images d’un dossier d’assets avec cache mémoire et cache disque."""
+
+    def __init__(self, root, cache_dir=None):
+        self.root = Path(root)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._images = {}             # (fichier, taille, colorkey, converti) -> Surface
+        self.hits = 0                 # servis depuis la mémoire
+        self.disk_hits = 0            # servis depuis le cache disque (pas de décodage)
+        self.misses = 0               # décodés et redimensionnés
+
+    def load(self, filename, size=None, colorkey=None):
+        """Image prête à l’emploi (convertie si une fenêtre existe, colorkey appliqué)."""
+        size = tuple(size) if size else None
+        display = pygame.display.get_surface() is not None   # convert() exige une fenêtre
+        key = (filename, size, colorkey, display)
+        surf = self._images.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        path = self.root / filename
+        if not path.exists():                                # si le fichier n’existe pas
+            print(f"[⚠] Fichier introuvable : {path}")
+            surf = pygame.Surface(size or (50, 50))          # carré rouge par défaut
+            surf.fill(RED)
+        else:
+            surf = self._load_pixels(path, size)
+            if display:
+                surf = surf.convert()
+            if colorkey is not None:
+                surf.set_colorkey(colorkey)                  # rend une couleur transparente
+        self._images[key] = surf
+        return surf
+
+    def clear(self):
+        """Vide le cache mémoire (le cache disque est conservé)."""
+        self._images.clear()
+
+    # --- Cache disque ---
+    def _load_pixels(self, path, size):
+        """Pixels redimensionnés : depuis le cache disque si possible, sinon décodage."""
+        data = path.read_bytes()
+        cache_file = None
+        if self.cache_dir is not None:
+            digest = hashlib.sha1(data).hexdigest()
+            suffix = f"{size[0]}x{size[1]}" if size else "orig"
+            cache_file = self.cache_dir / f"{digest}_{suffix}.rgb"
+            surf = self._read_cache(cache_file)
+            if surf is not None:
+                self.disk_hits += 1
+                return surf
+
+        self.misses += 1
+        img = pygame.image.load(path)
+        if size:
+            if img.get_bitsize() < 24:                       # smoothscale exige 24/32 bits
+                img = img.convert(24, 0)
+            img = pygame.transform.smoothscale(img, size)    # redimensionne si demandé
+        if cache_file is not None:
+            self._write_cache(cache_file, img)
+        return img
+
+    @staticmethod
+    def _read_cache(cache_file):
+        try:
+            raw = cache_file.read_bytes()
+        except OSError:
+            return None
+        if len(raw) < _HEADER.size:
+            return None
+        magic, w, h = _HEADER.unpack_from(raw)
+        pixels = raw[_HEADER.size:]
+        if magic != _MAGIC or len(pixels) != w * h * 3:      # fichier corrompu ou tronqué
+            return None
+        return pygame.image.frombytes(pixels, (w, h), "RGB")
+
+    def _write_cache(self, cache_file, surf):
+        """Écrit le cache de façon atomique ; une erreur d’écriture n’est pas bloquante."""
+        w, h = surf.get_size()
+        tmp = cache_file.with_suffix(f".tmp{os.getpid()}")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(_HEADER.pack(_MAGIC, w, h) + pygame.image.tobytes(surf, "RGB"))
+            os.replace(tmp, cache_file)
+        except OSError as exc:
+            print(f"[⚠] Cache d’assets non écrit : {exc}")
+
+    def stats(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "loaded": len(self._images)}
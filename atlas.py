@@ -0,0 +1,114 @@
+# ---------------------------------------------------------------
+# Atlas de sprites : toute l’imagerie du jeu dans une seule Surface
+# ---------------------------------------------------------------
+# Les images (joueur, ennemi, balles, et plus tard les frames d’explosion) sont
+# rangées par étagères dans une seule Surface à alpha par pixel, convertie au format
+# de l’écran (convert_alpha) : chaque sprite n’est plus qu’une sous-surface
+# (subsurface) de l’atlas, qui partage ses pixels. Pour chaque frame, un masque de
+# collision (pygame.mask) est calculé une fois, à la construction.
+#
+# Le colorkey des JPEG (fond blanc du joueur) est remplacé par de l’alpha : les
+# pixels PROCHES de la couleur clé deviennent transparents, ce qui supprime le liseré
+# laissé par smoothscale, et les blits passent par le chemin alpha au lieu du colorkey.
+#
+#   atlas = SpriteAtlas()
+#   atlas.add("player", image, colorkey=WHITE)
+#   atlas.add_frames("explosion", [frame0, frame1, ...])
+#   atlas.build()
+#   atlas["player"], atlas.frames("explosion"), atlas.mask("player")
+import pygame
+
+PADDING = 1                  # px vides entre deux images (pas de débordement au filtrage)
+MAX_WIDTH = 512              # largeur des étagères (élargie si une image est plus large)
+ALPHA_THRESHOLD = 127        # alpha minimal d’un pixel "plein" dans les masques
+COLORKEY_TOLERANCE = 48      # écart maximal par canal pour rendre un pixel transparent
+
+
+def to_alpha(surface, colorkey=None, tolerance=COLORKEY_TOLERANCE):
+    """Copie à alpha par pixel de surface ; les pixels proches de colorkey sont transparents."""
+    image = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    image.blit(surface, (0, 0))
+    if colorkey is not None:
+        keep = pygame.mask.from_threshold(surface, colorkey, (tolerance, tolerance, tolerance, 255))
+        keep.invert()                                # pixels à garder
+        alpha = keep.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(255, 255, 255, 0))
+        image.blit(alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return image
+
+
+class SpriteAtlas:
+    """Images du jeu regroupées dans une Surface ; une sous-surface et un masque par frame."""
+
+    def __init__(self, padding=PADDING, max_width=MAX_WIDTH):
+        self.padding = padding
+        self.max_width = max_width
+        self.surface = None                  # Surface unique (après build())
+        self._sources = {}                   # nom -> [Surface alpha] en attente de build()
+        self._frames = {}                    # nom -> [sous-surface de l’atlas]
+        self._masks = {}                     # nom -> [Mask]
+        self.rects = {}                      # nom -> [Rect dans l’atlas]
+
+    def add(self, name, surface, colorkey=None):
+        """Ajoute une image (une seule frame)."""
+        self.add_frames(name, [surface], colorkey)
+
+    def add_frames(self, name, surfaces, colorkey=None):
+        """Ajoute une animation : frames dans l’ordre, même nom."""
+        if self.surface is not None:
+            raise RuntimeError("atlas déjà construit : ajouter les images avant build()")
+        self._sources[name] = [to_alpha(s, colorkey) for s in surfaces]
+
+    def build(self):
+        """Range les images par étagères (les plus hautes d’abord) dans une seule Surface."""
+        pad = self.padding
+        items = [(name, i, s) for name, frames in self._sources.items() for i, s in enumerate(frames)]
+        items.sort(key=lambda item: item[2].get_height(), reverse=True)
+        width = max([self.max_width] + [s.get_width() + 2 * pad for _, _, s in items])
+        places = []
+        x = y = shelf = 0
+        for name, i, s in items:
+            w, h = s.get_width() + 2 * pad, s.get_height() + 2 * pad
+            if x + w > width:                        # étagère pleine : la suivante
+                x, y, shelf = 0, y + shelf, 0
+            places.append((name, i, s, pygame.Rect(x + pad, y + pad, s.get_width(), s.get_height())))
+            x += w
+            shelf = max(shelf, h)
+
+        atlas = pygame.Surface((width, max(y + shelf, 1)), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+        for _name, _i, s, rect in places:
+            atlas.blit(s, rect)
+        if pygame.display.get_surface() is not None:  # format natif de l’écran
+            atlas = atlas.convert_alpha()
+        self.surface = atlas
+
+        for name, frames in self._sources.items():
+            self._frames[name] = [None] * len(frames)
+            self._masks[name] = [None] * len(frames)
+            self.rects[name] = [None] * len(frames)
+        for name, i, _s, rect in places:
+            sub = atlas.subsurface(rect)
+            self._frames[name][i] = sub
+            self._masks[name][i] = pygame.mask.from_surface(sub, ALPHA_THRESHOLD)
+            self.rects[name][i] = rect
+        self._sources.clear()
+        return self
+
+    def __contains__(self, name):
+        return name in self._frames
+
+    def __getitem__(self, name):
+        """Première (ou seule) frame de l’image."""
+        return self._frames[name][0]
+
+    def frames(self, name):
+        return self._frames[name]
+
+    def mask(self, name, frame=0):
+        """Masque de collision précalculé d’une frame."""
+        return self._masks[name][frame]
+
+    def stats(self):
+        w, h = self.surface.get_size() if self.surface is not None else (0, 0)
+        return {"images": len(self._frames), "frames": sum(map(len, self._frames.values())),
+                "size": (w, h)}
@@ -0,0 +1,230 @@
+# ---------------------------------------------------------------
+# Benchmark reproductible de la simulation et du rendu (mainwithasset.Game)
+# ---------------------------------------------------------------
+# Lancer :
+#   python bench.py                         -> mesure tous les scénarios
+#   python bench.py --save baseline.json    -> mesure et enregistre une référence
+#   python bench.py --compare baseline.json -> mesure et compare à la référence
+#                                              (code de sortie 1 si régression)
+#   options : --frames N, --repeat R, --vectorized, --tolerance 0.10, scénarios...
+#
+# Chaque scénario est une partie headless à graine fixe, pilotée par un script
+# d’actions (aucune entrée clavier, aucun temps réel) : deux exécutions jouent
+# exactement les mêmes frames. Pour chacun on mesure :
+#   - fps_sim    : frames/s de Game.step seul (meilleure de R répétitions),
+#   - fps_render : frames/s de Game.step + Game.draw (idem),
+#   - phases     : p50 / p95 / moyenne par phase (profileur du jeu, en ms),
+#   - peak_kib   : pic de mémoire Python pendant la partie (tracemalloc),
+#   - updates_avoided : appels update() évités par frame (Game.scheduler).
+# Le joueur est rendu invincible : les scénarios ne s’arrêtent pas sur un Game Over
+# dû aux balles ; une flotte arrivée en bas relance simplement la partie.
+# endless_soak enchaîne des vagues générées de 165 ennemis (plafond de la grille) : le p95
+# de la phase "fleet" y révèle les pics de frame à l’apparition d’une vague.
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from mainwithasset import (ACTION_FIRE, ACTION_LEFT, ACTION_RIGHT, Enemy, Game, HEIGHT,
+                           PLAYING, WIDTH)
+from waves import CELL_X, ROW_MIN
+
+FRAMES = 1000               # frames mesurées par scénario
+REPEAT = 3                  # répétitions (on garde la plus rapide)
+MEMORY_FRAMES = 300         # frames jouées sous tracemalloc (beaucoup plus lent)
+TOLERANCE = 0.10            # écart toléré avant de signaler une régression
+SEED = 1234
+
+
+# --- Scénarios ---
+def sweep(game):
+    """Script d’actions : va-et-vient toutes les secondes en tirant en continu."""
+    return (ACTION_LEFT if (game.frame // 60) % 2 else ACTION_RIGHT) | ACTION_FIRE
+
+
+def invincible(game):
+    game.player.lives = 10 ** 9
+
+
+def big_fleet(n, cols=(WIDTH - 100) // CELL_X, bottom=300):
+    """Remplace la formation par n ennemis sur la grille des vagues générées (45 x 30 px,
+    aucun chevauchement) : la dernière rangée est à `bottom`, les rangées qui ne tiennent
+    pas à l’écran attendent au-dessus, comme une flotte qui descend."""
+    top = bottom - (-(-n // cols) - 1) * ROW_MIN
+
+    def setup(game):
+        invincible(game)
+        for e in game.enemies.sprites():
+            e.kill()
+        for i in range(n):
+            e = Enemy(40 + (i % cols) * CELL_X, top + (i // cols) * ROW_MIN, game.enemy_img)
+            game.enemies.add(e)
+            game.all_sprites.add(e)
+            game.fleet.add(e)
+    return setup
+
+
+def no_cooldown(game):
+    invincible(game)
+    game.player.shoot_cooldown = 0            # un tir à chaque frame
+
+
+def endless_from(number):
+    """Mode infini : la flotte en cours est vidée, la vague suivante sera la n° number."""
+    def setup(game):
+        no_cooldown(game)
+        game.waves.endless = True
+        game.waves.number = number - 1
+        for e in game.enemies.sprites():
+            e.kill()
+    return setup
+
+
+class BulletStorm:
+    """Maintient `count` balles ennemies à l’écran (complétées à chaque frame)."""
+
+    def __init__(self, count):
+        self.count = count
+        self.rng = random.Random(SEED)
+
+    def setup(self, game):
+        invincible(game)
+        self.rng.seed(SEED)
+
+    def __call__(self, game):
+        rng = self.rng
+        for _ in range(self.count - len(game.enemy_bullets)):
+            x, y = rng.randrange(WIDTH), rng.randrange(HEIGHT // 2)
+            if game.vectorized_bullets:
+                game.enemy_bullets.spawn(x, y)
+            else:
+                b = game.enemy_bullet_pool.acquire(x, y)
+                game.enemy_bullets.add(b)
+                game.all_sprites.add(b)
+        return sweep(game)
+
+
+def scenarios():
+    """nom -> (setup(game), policy(game) -> actions)."""
+    storm = BulletStorm(5000)
+    return {
+        "fleet_21": (invincible, sweep),
+        "fleet_500": (big_fleet(500), sweep),
+        "bullet_storm_5000": (storm.setup, storm),
+        "max_fire": (no_cooldown, sweep),
+        "endless_soak": (endless_from(10), sweep),
+    }
+
+
+# --- Mesures ---
+def play(setup, policy, frames, render=False, profile=False, vectorized=False):
+    """Joue `frames` frames ; renvoie (secondes, game). Relance la partie si elle se termine."""
+    game = Game(headless=True, seed=SEED, vectorized_bullets=vectorized, profile=profile)
+    setup(game)
+    prof = game.profiler
+    start = time.perf_counter()
+    for _ in range(frames):
+        if game.state != PLAYING:
+            game.reset()
+            setup(game)
+        with prof.section("update"):
+            game.step(policy(game))
+        if render:
+            with prof.section("draw"):
+                game.draw()
+        prof.end_frame()
+    return time.perf_counter() - start, game
+
+
+def measure(name, frames=FRAMES, repeat=REPEAT, vectorized=False):
+    setup, policy = scenarios()[name]
+    sim = min(play(setup, policy, frames, vectorized=vectorized)[0] for _ in range(repeat))
+    best, game = None, None
+    for _ in range(repeat):
+        elapsed, g = play(setup, policy, frames, render=True, profile=True, vectorized=vectorized)
+        if best is None or elapsed < best:
+            best, game = elapsed, g
+    phases = {phase: {k: round(v, 4) for k, v in stats.items() if k in ("p50", "p95", "mean")}
+              for phase, stats in game.profiler.report().items()}
+
+    tracemalloc.start()
+    play(setup, policy, min(frames, MEMORY_FRAMES), render=True, vectorized=vectorized)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"fps_sim": round(frames / sim, 1), "fps_render": round(frames / best, 1),
+            "peak_kib": round(peak / 1024, 1), "phases": phases,
+            "updates_avoided": round(game.scheduler.stats()["avoided"], 1)}
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Lignes de comparaison et liste des régressions (fps en baisse, mémoire en hausse)."""
+    lines, regressions = [], []
+    for name, res in results.items():
+        ref = baseline["results"].get(name)
+        if ref is None:
+            lines.append(f"{name:<20} (absent de la référence)")
+            continue
+        for key, higher_is_better in (("fps_sim", True), ("fps_render", True), ("peak_kib", False)):
+            ratio = res[key] / ref[key] if ref[key] else 1.0
+            bad = ratio < 1 - tolerance if higher_is_better else ratio > 1 + tolerance
+            lines.append(f"{name:<20} {key:<11} {ref[key]:>10.1f} -> {res[key]:>10.1f} "
+                         f"({(ratio - 1) * 100:+6.1f} %){'  <-- RÉGRESSION' if bad else ''}")
+            if bad:
+                regressions.append((name, key))
+    return lines, regressions
+
+
+def main(argv):
+    args = list(argv)
+
+    def option(flag, default, cast=str):
+        if flag in args:
+            i = args.index(flag)
+            value = cast(args[i + 1])
+            del args[i:i + 2]
+            return value
+        return default
+
+    frames = option("--frames", FRAMES, int)
+    repeat = option("--repeat", REPEAT, int)
+    tolerance = option("--tolerance", TOLERANCE, float)
+    save_path = option("--save", None)
+    compare_path = option("--compare", None)
+    vectorized = "--vectorized" in args
+    if vectorized:
+        args.remove("--vectorized")
+    names = args or list(scenarios())
+
+    config = {"frames": frames, "seed": SEED, "vectorized": vectorized}
+    results = {}
+    print(f"{'scénario':<20} {'fps sim':>10} {'fps rendu':>10} {'pic mém.':>11}")
+    for name in names:
+        res = results[name] = measure(name, frames, repeat, vectorized)
+        print(f"{name:<20} {res['fps_sim']:>10.0f} {res['fps_render']:>10.0f} {res['peak_kib']:>7.0f} KiB"
+              f"   ({res['updates_avoided']:.0f} appels update() évités / frame)")
+        for phase, stats in sorted(res["phases"].items()):
+            print(f"    {phase:<16} p50 {stats['p50']:.3f}  p95 {stats['p95']:.3f}  "
+                  f"moy. {stats['mean']:.3f} ms")
+
+    if save_path:
+        with open(save_path, "w") as f:
+            json.dump({"config": config, "results": results}, f, indent=1)
+        print(f"Référence enregistrée dans {save_path}")
+
+    if compare_path:
+        with open(compare_path) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config:
+            print(f"[⚠] configuration différente de la référence : {baseline.get('config')}")
+        lines, regressions = compare(results, baseline, tolerance)
+        print("\n".join(lines))
+        if regressions:
+            print(f"{len(regressions)} régression(s) au-delà de {tolerance:.0%}")
+            return 1
+        print("Aucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
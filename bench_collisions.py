@@ -0,0 +1,83 @@
+# ---------------------------------------------------------------
+# Benchmark : groupcollide de pygame vs grille de hachage spatial
+# ---------------------------------------------------------------
+# Lancer : python bench_collisions.py
+# Pour chaque taille de flotte et volume de tir, mesure le temps moyen d’une frame
+# de collisions (flotte qui se déplace d’1 px + test balles ↔ ennemis) avec :
+#   - pygame.sprite.groupcollide (toutes les paires),
+#   - SpatialHash.sync + SpatialHash.groupcollide (cellules communes seulement),
+# et vérifie que les deux renvoient le même nombre d’ennemis touchés.
+import random
+import time
+
+import pygame
+
+from spatial_hash import SpatialHash
+
+WIDTH, HEIGHT = 800, 600
+FLEETS = (21, 200, 1000, 5000)      # nombre d’ennemis
+SALVOS = (10, 100, 1000)            # nombre de balles du joueur à l’écran
+FRAMES = 30                         # frames mesurées par configuration
+
+
+def make_scene(n_enemies, n_bullets, seed=0):
+    """Flotte en grille serrée (40x25, pas de 45x30) et balles réparties au hasard."""
+    rng = random.Random(seed)
+    enemy_img = pygame.Surface((40, 25))
+    bullet_img = pygame.Surface((8, 24))
+    cols = max(1, min(n_enemies, (WIDTH - 20) // 45))
+    enemies = pygame.sprite.Group()
+    for i in range(n_enemies):
+        e = pygame.sprite.Sprite()
+        e.image = enemy_img
+        e.rect = enemy_img.get_rect(topleft=(10 + (i % cols) * 45, 10 + (i // cols) * 30))
+        enemies.add(e)
+    bottom = max(e.rect.bottom for e in enemies)
+    bullets = pygame.sprite.Group()
+    for _ in range(n_bullets):
+        b = pygame.sprite.Sprite()
+        b.image = bullet_img
+        b.rect = bullet_img.get_rect(topleft=(rng.randrange(WIDTH), rng.randrange(bottom + 200)))
+        bullets.add(b)
+    return enemies, bullets
+
+
+def bench_pygame(enemies, bullets):
+    start = time.perf_counter()
+    total = 0
+    for f in range(FRAMES):
+        step = 1 if f % 2 == 0 else -1
+        for e in enemies:
+            e.rect.x += step
+        total += len(pygame.sprite.groupcollide(enemies, bullets, False, False))
+    return (time.perf_counter() - start) / FRAMES, total
+
+
+def bench_hash(enemies, bullets):
+    grid = SpatialHash()
+    start = time.perf_counter()
+    total = 0
+    for f in range(FRAMES):
+        step = 1 if f % 2 == 0 else -1
+        for e in enemies:
+            e.rect.x += step
+        grid.sync(enemies)
+        total += len(grid.groupcollide(bullets, False, False))
+    return (time.perf_counter() - start) / FRAMES, total
+
+
+def main():
+    print(f"{'ennemis':>8} {'balles':>7} {'groupcollide':>14} {'spatial hash':>14} {'gain':>7}")
+    for n_enemies in FLEETS:
+        for n_bullets in SALVOS:
+            enemies, bullets = make_scene(n_enemies, n_bullets)
+            t_ref, hits_ref = bench_pygame(enemies, bullets)
+            enemies, bullets = make_scene(n_enemies, n_bullets)
+            t_hash, hits_hash = bench_hash(enemies, bullets)
+            assert hits_ref == hits_hash, (n_enemies, n_bullets, hits_ref, hits_hash)
+            print(f"{n_enemies:>8} {n_bullets:>7} {t_ref * 1e3:>11.3f} ms {t_hash * 1e3:>11.3f} ms "
+                  f"{t_ref / t_hash:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
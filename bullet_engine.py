@@ -0,0 +1,200 @@
+# ---------------------------------------------------------------
+# Moteur vectorisé pour les balles ennemies (structure de tableaux)
+# ---------------------------------------------------------------
+# Au lieu d’un Sprite par balle (un appel update() + math.sin + kill() par balle),
+# toutes les balles ennemies sont rangées dans des tableaux NumPy contigus :
+# une seule opération sin/add fait avancer toutes les balles, et un seul masque
+# booléen supprime celles qui sortent de l’écran.
+#
+# NumPy est optionnel : sans lui, le jeu garde les EnemyBullet classiques.
+import math
+import pygame
+
+from swept import mask_time
+
+try:
+    import numpy as np
+except ImportError:      # NumPy absent -> moteur indisponible (HAS_NUMPY = False)
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class EnemyBulletArrays:
+    """Pool de balles ennemies sinusoïdales stockées en tableaux NumPy.
+
+    Même trajectoire que EnemyBullet : x = spawn_x + amp·sin(phase + ω·t) + drift·(t·fps),
+    y augmente de speed px par frame, balle supprimée hors écran (marge de 40 px sur X).
+    """
+
+    FIELDS = ("spawn_x", "pos_y", "t", "omega", "amp", "phase", "drift", "speed", "x", "y",
+              "prev_x", "prev_y")
+
+    def __init__(self, width, height, fps, capacity=256, size=(4, 12), color=(220, 80, 80),
+                 image=None):
+        if not HAS_NUMPY:
+            raise ImportError("EnemyBulletArrays nécessite numpy (pip install numpy)")
+        self.width, self.height, self.fps = width, height, fps
+        if image is None:                                      # forme unie par défaut
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            image.fill(color)
+        self.image = image                                     # une seule surface partagée
+        self.mask = pygame.mask.from_surface(image)            # son masque (collisions au pixel)
+        self.w, self.h = image.get_size()                      # taille commune des balles
+        self.count = 0                                         # nombre de balles actives
+        self.linger = False        # True : balle hors écran retirée au pas suivant (swept)
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        """(Ré)alloue les tableaux en conservant les balles actives."""
+        n = self.count
+        for name in self.FIELDS:
+            dtype = np.int64 if name in ("x", "y", "prev_x", "prev_y") else np.float64
+            arr = np.zeros(capacity, dtype=dtype)
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def clear(self):
+        """Supprime toutes les balles (sans réallouer)."""
+        self.count = 0
+
+    def spawn(self, x, y, speed=4, amp=60, freq=1.2, phase=0.0, drift=0.0):
+        """Ajoute une balle dont le milieu-haut est en (x, y)."""
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)                     # croissance géométrique
+        i = self.count
+        self.spawn_x[i] = x
+        self.pos_y[i] = y
+        self.t[i] = 0.0
+        self.omega[i] = 2.0 * math.pi * freq
+        self.amp[i] = amp
+        self.phase[i] = phase
+        self.drift[i] = drift
+        self.speed[i] = speed
+        self.x[i] = self.prev_x[i] = int(x) - self.w // 2     # rect.midtop = (x, y)
+        self.y[i] = self.prev_y[i] = int(y)
+        self.count += 1
+
+    def update(self, dt=1):
+        """Fait avancer toutes les balles de dt frames puis retire celles hors écran."""
+        if self.linger:                                        # sorties du pas précédent
+            out = self._outside()
+            if out.any():
+                self._compact(~out)
+        n = self.count
+        if not n:
+            return
+        self.prev_x[:n] = self.x[:n]                           # pour l’interpolation du rendu
+        self.prev_y[:n] = self.y[:n]
+        t = self.t[:n]
+        t += dt / self.fps
+        pos_y = self.pos_y[:n]
+        pos_y += self.speed[:n] * dt
+        cx = self.spawn_x[:n] + self.amp[:n] * np.sin(self.phase[:n] + self.omega[:n] * t) \
+            + self.drift[:n] * (t * self.fps)
+        # int() tronque vers zéro comme dans EnemyBullet.update
+        self.x[:n] = np.trunc(cx).astype(np.int64) - self.w // 2
+        self.y[:n] = np.trunc(pos_y).astype(np.int64)
+        if not self.linger:
+            out = self._outside()
+            if out.any():
+                self._compact(~out)
+
+    def _outside(self):
+        """Masque des balles hors écran (marge de 40 px sur X)."""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        return (y > self.height) | (x + self.w < -40) | (x > self.width + 40)
+
+    def _compact(self, keep):
+        """Ne garde que les balles du masque keep (ordre conservé)."""
+        n = self.count
+        k = int(keep.sum())
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.count = k
+
+    def collide_rect(self, rect, dokill=True, mask=None):
+        """Nombre de balles qui chevauchent rect (même test que Rect.colliderect).
+
+        mask : masque de la cible ; s’il est donné, les balles dont le rect chevauche
+               rect sont ensuite testées au pixel près (masque des balles).
+        """
+        n = self.count
+        if not n:
+            return 0
+        x, y = self.x[:n], self.y[:n]
+        hit = (x < rect.right) & (rect.left < x + self.w) & (y < rect.bottom) & (rect.top < y + self.h)
+        if mask is not None and hit.any():                     # phase fine sur les candidates
+            own = self.mask
+            for i in np.flatnonzero(hit).tolist():
+                if mask.overlap(own, (int(x[i]) - rect.x, int(y[i]) - rect.y)) is None:
+                    hit[i] = False
+        hits = int(hit.sum())
+        if hits and dokill:
+            self._compact(~hit)
+        return hits
+
+    def collide_rect_swept(self, rect, delta=(0, 0), dokill=True, mask=None):
+        """Comme collide_rect, mais sur tout le trajet du dernier pas (swept AABB).
+
+        delta : déplacement de rect pendant le pas (mouvement relatif balle / cible).
+        mask  : masque de la cible ; s’il est donné, le trajet de chaque balle candidate
+                est ensuite testé au pixel près (swept.mask_time).
+        """
+        n = self.count
+        if not n:
+            return 0
+        x0 = self.prev_x[:n] + delta[0]                       # départ dans le repère de la cible
+        y0 = self.prev_y[:n] + delta[1]
+        dx, dy = self.x[:n] - x0, self.y[:n] - y0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_enter = np.full(n, -np.inf)
+            t_exit = np.full(n, np.inf)
+            ok = np.ones(n, dtype=bool)
+            for pos, size, d, lo, hi in ((x0, self.w, dx, rect.left, rect.right),
+                                         (y0, self.h, dy, rect.top, rect.bottom)):
+                still = d == 0
+                ok &= ~still | ((pos < hi) & (lo < pos + size))  # immobile : recouvrement strict
+                a, b = (lo - (pos + size)) / d, (hi - pos) / d
+                a, b = np.where(still, -np.inf, np.minimum(a, b)), np.where(still, np.inf, np.maximum(a, b))
+                np.maximum(t_enter, a, out=t_enter)
+                np.minimum(t_exit, b, out=t_exit)
+        hit = ok & (t_enter < t_exit) & (t_enter < 1) & (t_exit > 0)
+        if mask is not None and hit.any():                     # phase fine sur les candidates
+            own = self.mask
+            t0, t1 = np.maximum(t_enter, 0.0), np.minimum(t_exit, 1.0)
+            for i in np.flatnonzero(hit).tolist():
+                if mask_time(rect, mask, own, float(x0[i]), float(y0[i]), float(dx[i]),
+                             float(dy[i]), float(t0[i]), float(t1[i])) is None:
+                    hit[i] = False
+        hits = int(hit.sum())
+        if hits and dokill:
+            self._compact(~hit)
+        return hits
+
+    def draw(self, surface, doreturn=False, alpha=1.0):
+        """Dessine toutes les balles avec la surface partagée.
+
+        doreturn : renvoie la liste des rects dessinés (rendu par zones modifiées).
+        alpha    : interpolation entre la position précédente (0) et l’actuelle (1).
+        """
+        n = self.count
+        if not n:
+            return [] if doreturn else None
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            px, py = self.prev_x[:n], self.prev_y[:n]
+            x = (px + (x - px) * alpha).astype(np.int64)
+            y = (py + (y - py) * alpha).astype(np.int64)
+        img = self.image
+        return surface.blits([(img, pos) for pos in zip(x.tolist(), y.tolist())], doreturn)
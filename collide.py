@@ -0,0 +1,90 @@
+# ---------------------------------------------------------------
+# Collisions au pixel près derrière une phase large par rectangles
+# ---------------------------------------------------------------
+# Un rect de 60x60 autour d’un vaisseau en grande partie transparent fait perdre des
+# vies sur des balles qui passent visiblement à côté. Ici les collisions se font en
+# deux temps :
+#   1. phase large : rects (groupcollide / spritecollide, grille spatiale de la flotte),
+#      qui élimine presque toutes les paires ;
+#   2. phase fine : pygame.mask.overlap, seulement pour les paires dont les rects se
+#      chevauchent. Les masques ne sont jamais recalculés : chaque sprite porte celui
+#      de son image, précalculé une fois dans l’atlas (attribut mask).
+#
+#   collider = MaskCollider()
+#   collider.spritecollide(player, enemy_bullets, True)
+#   fleet.groupcollide(bullets, True, True, collider)
+#
+# Passer collider directement à pygame.sprite.spritecollide ferait un appel Python par
+# paire (plus de test de rects rapide) : spritecollide / groupcollide gardent la phase
+# large de pygame et n’appellent le collider que sur les candidats.
+#
+# Les collisions continues (swept.py) passent le collider à fleet_collide /
+# sprite_collide : sweep() teste alors les masques sur le trajet du pas.
+import pygame
+
+from swept import mask_time
+
+
+class MaskCollider:
+    """Collisions en deux phases : rects, puis masques des seules paires candidates."""
+
+    def __init__(self):
+        self.pairs = 0             # paires candidates reçues
+        self.mask_tests = 0        # paires aux rects chevauchants (test des masques)
+        self.hits = 0              # collisions confirmées au pixel près
+
+    def __call__(self, a, b):
+        self.pairs += 1
+        ra, rb = a.rect, b.rect
+        if not ra.colliderect(rb):
+            return False
+        self.mask_tests += 1
+        ma, mb = a.mask, b.mask
+        if ma is None or mb is None:               # sprite sans masque : le rect suffit
+            hit = True
+        else:
+            hit = ma.overlap(mb, (rb.x - ra.x, rb.y - ra.y)) is not None
+        self.hits += hit
+        return hit
+
+    def sweep(self, target, b, x, y, dx, dy, t0, t1):
+        """Premier instant de [t0, t1] où b (boîte en (x + t·dx, y + t·dy)) touche target
+        au pixel près ; None sinon. [t0, t1] : chevauchement des boîtes (swept.py)."""
+        self.pairs += 1
+        self.mask_tests += 1
+        if target.mask is None or b.mask is None:  # sprite sans masque : le rect suffit
+            t = t0
+        else:
+            t = mask_time(target.rect, target.mask, b.mask, x, y, dx, dy, t0, t1)
+        self.hits += t is not None
+        return t
+
+    def spritecollide(self, sprite, group, dokill):
+        """pygame.sprite.spritecollide(sprite, group, dokill), confirmé au pixel près."""
+        hits = [s for s in pygame.sprite.spritecollide(sprite, group, False) if self(sprite, s)]
+        if dokill:
+            for s in hits:
+                s.kill()
+        return hits
+
+    def groupcollide(self, group_a, group_b, dokill_a, dokill_b):
+        """pygame.sprite.groupcollide(group_a, group_b, ...), confirmé au pixel près
+        (même ordre : un sprite de group_b tué n’est attribué qu’au premier touché)."""
+        hits, killed = {}, set()
+        for a, candidates in pygame.sprite.groupcollide(group_a, group_b, False, False).items():
+            touched = [b for b in candidates if b not in killed and self(a, b)]
+            if not touched:
+                continue
+            hits[a] = touched
+            if dokill_b:
+                killed.update(touched)
+                for b in touched:
+                    b.kill()
+            if dokill_a:
+                a.kill()
+        return hits
+
+    def stats(self):
+        """Compteurs : paires testées, tests de masques, collisions et rejets au pixel."""
+        return {"pairs": self.pairs, "mask_tests": self.mask_tests, "hits": self.hits,
+                "rejected": self.mask_tests - self.hits}
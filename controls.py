@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------
+# Entrées du joueur : événements clavier -> masque d’actions par frame
+# ---------------------------------------------------------------
+# Le jeu ne lit plus le clavier (pygame.key.get_pressed) : Controls reçoit les
+# événements KEYDOWN / KEYUP et tient à jour les actions maintenues. À chaque pas de
+# simulation, snapshot() renvoie UN entier (masque ACTION_*), la seule entrée que
+# voit la simulation — un bot, un replay ou un client réseau fournit le même entier.
+#
+#   - les touches se remappent (bind / unbind) ;
+#   - une action déclenchée au KEYDOWN (tir, rejouer) n’est jamais perdue, même si la
+#     touche est relâchée avant le pas suivant ;
+#   - autofire : tir maintenu = tir à chaque pas (le cooldown du joueur fixe la cadence).
+import pygame
+
+# --- Actions du joueur (masque de bits) ---
+# Une frame d'entrée = combinaison de ces bits : utilisable au clavier comme par un bot.
+ACTION_LEFT = 1            # se déplacer à gauche
+ACTION_RIGHT = 2           # se déplacer à droite
+ACTION_FIRE = 4            # tirer (si le cooldown le permet)
+ACTION_RESTART = 8         # rejouer (seulement en Game Over)
+
+DEFAULT_BINDINGS = {
+    pygame.K_LEFT: ACTION_LEFT,
+    pygame.K_RIGHT: ACTION_RIGHT,
+    pygame.K_a: ACTION_FIRE,
+    pygame.K_r: ACTION_RESTART,
+}
+
+
+class Controls:
+    """Traduit les événements clavier en un masque d’actions par pas de simulation."""
+
+    def __init__(self, bindings=None, autofire=False):
+        self.bindings = dict(DEFAULT_BINDINGS if bindings is None else bindings)  # touche -> action
+        self.autofire = autofire
+        self.held = 0              # actions dont une touche est enfoncée
+        self.pressed = 0           # actions déclenchées depuis le dernier snapshot()
+        self._down = {}            # touche enfoncée -> action
+
+    def bind(self, key, action):
+        """Associe une touche à une action (remplace l’éventuelle association de la touche)."""
+        self.bindings[key] = action
+
+    def unbind(self, key):
+        self.bindings.pop(key, None)
+
+    def handle(self, event):
+        """Prend en compte un événement ; renvoie True s’il concerne une action."""
+        if event.type == pygame.KEYDOWN:
+            action = self.bindings.get(event.key)
+            if action is None:
+                return False
+            self._down[event.key] = action
+            self.held |= action
+            self.pressed |= action
+            return True
+        if event.type == pygame.KEYUP:
+            if self._down.pop(event.key, None) is None:
+                return False
+            self.held = 0
+            for action in self._down.values():   # une autre touche peut tenir l’action
+                self.held |= action
+            return True
+        if event.type == pygame.WINDOWFOCUSLOST:  # les KEYUP n’arriveront pas
+            self.release_all()
+        return False
+
+    def release_all(self):
+        self._down.clear()
+        self.held = 0
+
+    def snapshot(self):
+        """Masque d’actions du pas à venir ; consomme les actions déclenchées."""
+        actions = self.pressed | (self.held & (ACTION_LEFT | ACTION_RIGHT))
+        if self.autofire:
+            actions |= self.held & ACTION_FIRE
+        self.pressed = 0
+        return actions
@@ -0,0 +1,196 @@
+# ---------------------------------------------------------------
+# Environnement type Gym + exécution vectorisée multiprocessus
+# ---------------------------------------------------------------
+# SpaceInvadersEnv : reset() / step(action) autour de Game en mode headless
+# (aucune fenêtre, pas de limite de FPS, hasard piloté par une graine).
+#
+# VecEnv : N parties indépendantes réparties sur un pool de processus. Les
+# actions, observations, récompenses et fins de partie transitent par de la
+# mémoire partagée (multiprocessing.shared_memory) : les processus ne s’envoient
+# qu’un court message "step" / "reset" par appel, jamais les tableaux eux-mêmes.
+#
+# Nécessite numpy.
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from mainwithasset import GAME_OVER, HEIGHT, WIDTH, Game
+from observation import ObservationEncoder
+from waves import WaveSequence
+
+# Actions discrètes : combinaison des bits ACTION_LEFT | ACTION_RIGHT | ACTION_FIRE
+N_ACTIONS = 8
+
+
+def obs_size(waves=None, endless=False, **_game_kwargs):
+    """Taille de l’observation par défaut pour ces options de Game (voir observation.py) :
+    assez d’emplacements pour la plus grande vague de la séquence."""
+    sequence = WaveSequence(waves, endless, None, WIDTH, HEIGHT)
+    return ObservationEncoder.size_for(sequence.capacity())
+
+
+# Observation d’une partie par défaut (dispositions de layouts/, sans vagues infinies)
+OBS_SIZE = obs_size()
+
+
+class SpaceInvadersEnv:
+    """Interface type Gym autour de mainwithasset.Game (headless)."""
+
+    def __init__(self, seed=None, max_steps=20_000, frame_skip=1, **game_kwargs):
+        self.game = Game(headless=True, seed=seed, **game_kwargs)
+        self.max_steps = max_steps          # tronque les parties trop longues
+        self.frame_skip = frame_skip        # frames jouées par appel à step()
+        self.steps = 0
+        self.encoder = ObservationEncoder(self.game)
+        self.obs = self.encoder.array       # tampon réécrit à chaque pas (pas de copie)
+
+    def reset(self, seed=None):
+        """Nouvelle partie (même graine => même partie) ; renvoie l’observation."""
+        game = self.game
+        if seed is not None:
+            game.seed = seed
+            game.rng.seed(seed)
+        game.frame = 0                      # horloge du jeu (cooldowns) repartie de zéro
+        game.reset()
+        self.steps = 0
+        self.encoder.encode()
+        return self.obs
+
+    def step(self, action):
+        """Joue action (0..N_ACTIONS-1) ; renvoie (obs, récompense, fini, infos)."""
+        game = self.game
+        score, lives = game.score, game.player.lives
+        for _ in range(self.frame_skip):
+            if game.step(action) == GAME_OVER:
+                break
+        self.steps += 1
+        reward = (game.score - score) - 10.0 * (lives - game.player.lives)
+        done = game.state == GAME_OVER or self.steps >= self.max_steps
+        info = {"score": game.score, "lives": game.player.lives, "frame": game.frame}
+        self.encoder.encode()
+        return self.obs, reward, done, info
+
+
+# --- Exécution vectorisée ---
+def _worker(conn, shm_names, n_envs, lo, hi, seeds, env_kwargs):
+    """Processus fils : fait tourner les parties [lo, hi) et écrit dans la mémoire partagée."""
+    shms = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    size = obs_size(**env_kwargs)
+    obs = np.ndarray((n_envs, size), dtype=np.float32, buffer=shms[0].buf)
+    actions = np.ndarray((n_envs,), dtype=np.uint8, buffer=shms[1].buf)
+    rewards = np.ndarray((n_envs,), dtype=np.float32, buffer=shms[2].buf)
+    dones = np.ndarray((n_envs,), dtype=np.uint8, buffer=shms[3].buf)
+    envs = [SpaceInvadersEnv(seed=seeds[i], **env_kwargs) for i in range(lo, hi)]
+    episodes = [0] * len(envs)
+    try:
+        while True:
+            cmd = conn.recv()
+            if cmd == "step":
+                for k, env in enumerate(envs):
+                    i = lo + k
+                    o, r, d, _ = env.step(int(actions[i]))
+                    rewards[i] = r
+                    dones[i] = d
+                    if d:                   # réinitialisation automatique, graine dérivée
+                        episodes[k] += 1
+                        o = env.reset(seeds[i] + episodes[k] * 1_000_003)
+                    obs[i] = o
+            elif cmd == "reset":
+                for k, env in enumerate(envs):
+                    episodes[k] = 0
+                    obs[lo + k] = env.reset(seeds[lo + k])
+            elif cmd == "close":
+                break
+            conn.send(True)
+    finally:
+        del obs, actions, rewards, dones   # libère les vues avant de fermer la mémoire
+        for shm in shms:
+            shm.close()
+        conn.close()
+
+
+class VecEnv:
+    """N parties headless réparties sur n_workers processus (mémoire partagée)."""
+
+    def __init__(self, n_envs, n_workers=None, seed=0, **env_kwargs):
+        self.n_envs = n_envs
+        n_workers = min(n_envs, n_workers or mp.cpu_count())
+        self.obs_size = obs_size(**env_kwargs)
+        sizes = (n_envs * self.obs_size * 4, n_envs, n_envs * 4, n_envs)
+        self._shms = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+        self.obs = np.ndarray((n_envs, self.obs_size), dtype=np.float32,
+                              buffer=self._shms[0].buf)
+        self.actions = np.ndarray((n_envs,), dtype=np.uint8, buffer=self._shms[1].buf)
+        self.rewards = np.ndarray((n_envs,), dtype=np.float32, buffer=self._shms[2].buf)
+        self.dones = np.ndarray((n_envs,), dtype=np.uint8, buffer=self._shms[3].buf)
+        seeds = [seed + i for i in range(n_envs)]
+        names = [shm.name for shm in self._shms]
+        self._conns, self._procs = [], []
+        bounds = np.linspace(0, n_envs, n_workers + 1).astype(int)
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker, daemon=True,
+                              args=(child, names, n_envs, int(lo), int(hi), seeds, env_kwargs))
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self.closed = False
+
+    def _broadcast(self, cmd):
+        for conn in self._conns:
+            conn.send(cmd)
+        for conn in self._conns:
+            conn.recv()
+
+    def reset(self):
+        """Réinitialise toutes les parties ; renvoie obs (vue sur la mémoire partagée)."""
+        self._broadcast("reset")
+        return self.obs
+
+    def step(self, actions):
+        """Une action par partie ; renvoie (obs, récompenses, fins) — vues partagées.
+
+        Les parties terminées sont relancées automatiquement (obs = nouvelle partie).
+        """
+        self.actions[:] = actions
+        self._broadcast("step")
+        return self.obs, self.rewards, self.dones
+
+    def close(self):
+        if self.closed:
+            return
+        for conn in self._conns:
+            conn.send("close")
+        for proc in self._procs:
+            proc.join()
+        del self.obs, self.actions, self.rewards, self.dones
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    # python env.py [n_envs] [n_workers] : débit de simulation en actions aléatoires
+    import sys
+    import time
+
+    n_envs = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    n_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    rng = np.random.default_rng(0)
+    with VecEnv(n_envs, n_workers) as venv:
+        venv.reset()
+        n_steps = 500
+        start = time.perf_counter()
+        for _ in range(n_steps):
+            venv.step(rng.integers(0, N_ACTIONS, n_envs))
+        elapsed = time.perf_counter() - start
+    print(f"{n_envs} parties, {len(venv._procs)} processus : {n_envs * n_steps / elapsed:.0f} frames/s")
@@ -0,0 +1,214 @@
+# ---------------------------------------------------------------
+# Flotte ennemie en formation (origine + emplacements fixes)
+# ---------------------------------------------------------------
+# Au lieu de déplacer chaque ennemi (e.rect.x += ...) à chaque frame, la flotte
+# ne stocke qu’une origine (x, y) et, pour chaque ennemi, un rect local fixe
+# (son emplacement dans la formation). La position à l’écran = origine + local,
+# calculée seulement quand on la lit (dessin, collisions).
+#
+# Les bords de la formation (min/max des colonnes, bas de la dernière rangée)
+# sont mis en cache et ne sont recalculés que lorsqu’un ennemi meurt :
+# déplacer la flotte et tester les bords coûte O(1), quelle que soit sa taille.
+#
+# Seule la ligne de front tire : un ennemi est masqué tant qu’un ennemi vivant plus
+# bas chevauche sa largeur (rangées décalées d’une demi-case comprises). Chaque
+# ennemi compte ceux qui le masquent ; la liste des tireurs possibles est tenue à
+# jour à l’ajout et à la mort d’un ennemi (bande verticale de la grille), et le
+# tireur est tiré au hasard en O(1) (shooter), sans reconstruire de liste à chaque tir.
+from collections import Counter
+from operator import attrgetter
+
+import pygame
+
+from spatial_hash import SpatialHash
+
+
+class Fleet:
+    """Formation d’ennemis : une origine mobile et des emplacements locaux fixes."""
+
+    def __init__(self, x=0, y=0):
+        self.x = x                                    # origine de la formation (px écran,
+        self.y = y                                    # flottante si le pas de temps l’est)
+        self.members = {}                             # ennemi -> None (ensemble ordonné)
+        self.alive = bytearray()                      # 1 octet par emplacement : 1 = vivant
+        self.hash = SpatialHash(rect_attr="local_rect")  # grille en coordonnées locales (statique)
+        # Compteurs d’emplacements encore occupés, pour les bords en cache
+        self._lefts = Counter()
+        self._rights = Counter()
+        self._tops = Counter()
+        self._bottoms = Counter()
+        self.min_left = self.max_right = self.min_top = self.max_bottom = 0
+        # Ligne de front : ennemi -> nombre d’ennemis vivants plus bas qui le masquent
+        self._blockers = {}
+        self._front = []                              # ennemis non masqués (tirage O(1))
+        self._front_index = {}                        # ennemi -> position dans _front
+
+    def __len__(self):
+        return len(self.members)
+
+    def __bool__(self):
+        return bool(self.members)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    # --- Composition de la formation ---
+    def add(self, enemy):
+        """Ajoute un ennemi à sa position écran actuelle (devient son emplacement fixe)."""
+        local = enemy.rect.move(-int(self.x), -int(self.y))
+        enemy.local_rect = local
+        enemy.fleet = self
+        enemy.slot = len(self.alive)                  # numéro d’emplacement (ordre d’ajout)
+        self.alive.append(1)
+        self.members[enemy] = None
+        self.hash.insert(enemy)
+        first = len(self.members) == 1
+        for counts, value in ((self._lefts, local.left), (self._rights, local.right),
+                              (self._tops, local.top), (self._bottoms, local.bottom)):
+            counts[value] += 1
+        if first:
+            self.min_left, self.max_right = local.left, local.right
+            self.min_top, self.max_bottom = local.top, local.bottom
+        else:
+            self.min_left = min(self.min_left, local.left)
+            self.max_right = max(self.max_right, local.right)
+            self.min_top = min(self.min_top, local.top)
+            self.max_bottom = max(self.max_bottom, local.bottom)
+        below, above = self._overlapping(enemy)
+        self._blockers[enemy] = len(below)
+        if not below:
+            self._push(enemy)
+        for e in above:                               # masqués par le nouveau venu
+            self._blockers[e] += 1
+            if self._blockers[e] == 1:
+                self._drop(e)
+
+    def skip(self):
+        """Réserve un emplacement déjà vide (ennemi détruit avant un instantané restauré)."""
+        self.alive.append(0)
+
+    def remove(self, enemy):
+        """Retire un ennemi (mort) ; met à jour les bords seulement si besoin."""
+        if enemy not in self.members:
+            return
+        del self.members[enemy]
+        self.alive[enemy.slot] = 0
+        self.hash.remove(enemy)
+        local = enemy.local_rect
+        if self._release(self._lefts, local.left) and local.left == self.min_left and self._lefts:
+            self.min_left = min(self._lefts)
+        if self._release(self._rights, local.right) and local.right == self.max_right and self._rights:
+            self.max_right = max(self._rights)
+        if self._release(self._tops, local.top) and local.top == self.min_top and self._tops:
+            self.min_top = min(self._tops)
+        if self._release(self._bottoms, local.bottom) and local.bottom == self.max_bottom and self._bottoms:
+            self.max_bottom = max(self._bottoms)
+        if self._blockers.pop(enemy) == 0:
+            self._drop(enemy)
+        for e in self._overlapping(enemy)[1]:         # démasqués s’il était le dernier
+            self._blockers[e] -= 1
+            if self._blockers[e] == 0:
+                self._push(e)
+
+    # --- Ligne de front ---
+    def _overlapping(self, enemy):
+        """(plus bas, plus haut) : ennemis vivants dont la largeur chevauche celle d’enemy.
+
+        Ceux du dessus sont rangés par emplacement : l’ordre des tireurs ne dépend pas de
+        l’ordre interne de la grille (identique après une restauration).
+        """
+        local = enemy.local_rect
+        strip = pygame.Rect(local.left, self.min_top, local.width,
+                            max(1, self.max_bottom - self.min_top))
+        below, above = [], []
+        for e in self.hash.query(strip):
+            r = e.local_rect
+            if e is enemy or r.right <= local.left or local.right <= r.left:
+                continue
+            if r.bottom > local.bottom:
+                below.append(e)
+            elif r.bottom < local.bottom:
+                above.append(e)
+        above.sort(key=attrgetter("slot"))
+        return below, above
+
+    def _push(self, enemy):
+        self._front_index[enemy] = len(self._front)
+        self._front.append(enemy)
+
+    def _drop(self, enemy):
+        """Retire enemy des tireurs en O(1) (le dernier prend sa place)."""
+        i = self._front_index.pop(enemy)
+        last = self._front.pop()
+        if last is not enemy:
+            self._front[i] = last
+            self._front_index[last] = i
+
+    def shooter(self, rng):
+        """Ennemi qui tire, au hasard parmi la ligne de front (None si flotte vide)."""
+        front = self._front
+        if not front:
+            return None
+        return front[rng.randrange(len(front))]
+
+    @property
+    def front_order(self):
+        """Emplacements des tireurs dans l’ordre du tirage (dépend de l’ordre des morts)."""
+        return tuple(e.slot for e in self._front)
+
+    @front_order.setter
+    def front_order(self, slots):
+        by_slot = {e.slot: e for e in self._front}
+        if sorted(slots) != sorted(by_slot):
+            raise ValueError("ligne de front différente de celle de la formation")
+        self._front = [by_slot[slot] for slot in slots]
+        self._front_index = {e: i for i, e in enumerate(self._front)}
+
+    @staticmethod
+    def _release(counts, value):
+        """Décrémente un compteur ; True si plus aucun ennemi n’occupe cette valeur."""
+        counts[value] -= 1
+        if counts[value] == 0:
+            del counts[value]
+            return True
+        return False
+
+    # --- Déplacement et bords (O(1)) ---
+    def move(self, dx, dy):
+        """Déplace toute la formation."""
+        self.x += dx
+        self.y += dy
+
+    @property
+    def left(self):
+        return self.x + self.min_left
+
+    @property
+    def right(self):
+        return self.x + self.max_right
+
+    @property
+    def top(self):
+        return self.y + self.min_top
+
+    @property
+    def bottom(self):
+        return self.y + self.max_bottom
+
+    def bbox(self):
+        """Rect englobant les ennemis vivants (coordonnées écran)."""
+        return pygame.Rect(int(self.x) + self.min_left, int(self.y) + self.min_top,
+                           self.max_right - self.min_left, self.max_bottom - self.min_top)
+
+    # --- Collisions ---
+    def collide_rect(self, rect):
+        """Ennemis dont le rect chevauche rect (boîte englobante puis grille locale)."""
+        if not self.members or not rect.colliderect(self.bbox()):
+            return []
+        local = rect.move(-int(self.x), -int(self.y))
+        return [e for e in self.hash.query(local) if local.colliderect(e.local_rect)]
+
+    def groupcollide(self, group, dokill_fleet, dokill_other, collided=None):
+        """Équivalent de pygame.sprite.groupcollide(enemies, group, ..., collided) pour la flotte."""
+        return self.hash.groupcollide(group, dokill_fleet, dokill_other,
+                                      offset=(int(self.x), int(self.y)), collided=collided)
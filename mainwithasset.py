@@ -2,8 +2,23 @@
 import random            # pour générer des événements aléatoires (ex. tirs ennemis)
 import pygame            # la bibliothèque principale pour le jeu 2D
 import sys               # pour quitter proprement le programme
-import math              # pour calculer les trajectoires sinusoïdales
+import time              # pour mesurer la vitesse de simulation (mode headless)
 from pathlib import Path # pour gérer les chemins de fichiers (assets) de façon portable
+from functools import partial  # routines de mise à jour avec options (systems)
+from bullet_engine import EnemyBulletArrays, HAS_NUMPY  # balles ennemies vectorisées (optionnel)
+from fleet import Fleet  # flotte en formation (origine + emplacements fixes)
+from text_cache import TextCache  # textes du HUD rasterisés une seule fois
+from controls import ACTION_FIRE, ACTION_LEFT, ACTION_RESTART, ACTION_RIGHT, Controls  # clavier -> masque d’actions
+from asset_cache import AssetManager  # images chargées une fois (+ cache disque)
+from atlas import SpriteAtlas  # images des sprites dans une seule Surface (+ masques)
+from collide import MaskCollider  # collisions au pixel près (après les rects)
+from pools import PooledSprite, SpritePool  # balles réutilisées au lieu d’être réallouées
+from profiler import FrameProfiler, NullProfiler  # temps par phase de la boucle
+from waves import WaveSequence  # vagues d’ennemis décrites dans layouts/*.wave
+from systems import UpdateScheduler  # mises à jour groupées par type d’entité
+from trajectories import TrajectoryCache  # trajectoires sinusoïdales précalculées
+import swept             # collisions continues (balles qui traverseraient leur cible)
+import snapshot          # instantanés de l’état complet (retour arrière)
 
 # --- Constantes globales du jeu ---
 WIDTH, HEIGHT = 800, 600   # dimensions de la fenêtre du jeu (pixels)
@@ -15,45 +30,132 @@ RED = (255, 0, 0)          # couleur rouge (utilisable pour erreur ou tir)
 PLAYING = 0                # état du jeu : en cours
 GAME_OVER = 1              # état du jeu : perdu ou terminé
 
+# En dessous de ce nombre d’ennemis, groupcollide (toutes les paires) reste plus rapide
+# que la grille spatiale (cf. bench_collisions.py).
+SPATIAL_HASH_MIN_ENEMIES = 64
+
+# --- Pas de temps fixe (Game.run) ---
+# Les vitesses sont exprimées en px par frame de référence (1 / FPS s) ; une mise à jour
+# de la simulation à sim_hz avance de dt = FPS / sim_hz frames de référence.
+MAX_FRAME_MS = 250         # un rendu plus long que ça n’est compté que pour 250 ms
+MAX_STEPS_PER_FRAME = 5    # au-delà, le retard est abandonné (anti "spiral of death")
+IDLE_WAIT_MS = 500         # écran figé : réveil au plus toutes les 500 ms sans événement
+
+# --- Vagues ---
+SPAWN_PER_FRAME = 64       # ennemis créés au plus par frame (grandes vagues étalées)
+
+# --- Réglages d’équilibrage (Game(tuning={...}) ; balayés par sweep.py) ---
+# Les facteurs s’appliquent aux réglages propres à chaque vague (layouts/*.wave).
+BALANCE = {
+    "shoot_cooldown": 250,   # temps minimal entre deux tirs du joueur (ms)
+    "player_speed": 5,       # vitesse horizontale du joueur (px / frame)
+    "fleet_speed": 1.0,      # facteur sur la vitesse horizontale de la flotte
+    "drop": 1.0,             # facteur sur la descente de la flotte à chaque rebond
+    "fire": 1.0,             # facteur sur la probabilité de tir ennemi
+    "bullet_speed": 4,       # vitesse verticale des balles ennemies (px / frame)
+    "bullet_amp": 60,        # amplitude de l’oscillation des balles ennemies (px)
+    "bullet_freq": 1.2,      # oscillations des balles ennemies par seconde
+}
+
 # --- Répertoire des assets ---
 # Cette ligne définit le dossier dans lequel se trouvent toutes les images du jeu.
 # On part du dossier où se trouve ce fichier Python (__file__), puis on ajoute "assets".
 ASSETS = Path(__file__).parent / "assets"
+# Cache disque des images déjà redimensionnées (reconstruit automatiquement si supprimé)
+ASSET_CACHE = Path(__file__).parent / ".asset_cache"
+# Un seul gestionnaire par processus : les images survivent aux reset() et aux parties
+ASSET_MANAGER = AssetManager(ASSETS, ASSET_CACHE)
 
 
 # ---------------------------------------------------------------
 # Classe représentant la balle du joueur
 # ---------------------------------------------------------------
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, image_surface, speed=-8):
-        """Crée une balle tirée par le joueur (qui monte vers le haut)."""
+class Bullet(PooledSprite):
+    mask = None                                      # masque de l’image (collisions au pixel)
+
+    def __init__(self, x=0, y=0, image_surface=None, speed=-8):
+        """Crée une balle tirée par le joueur (qui monte vers le haut).
+
+        Sans image, la balle est créée vide (préallocation d’un SpritePool).
+        """
         super().__init__()                            # initialise la classe Sprite
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        if image_surface is not None:
+            self.spawn(x, y, image_surface, speed)
+
+    def spawn(self, x, y, image_surface, speed=-8):
+        """(Ré)initialise la balle : à la création et à chaque sortie du pool."""
         self.image = image_surface                    # image affichée pour la balle
-        self.rect = self.image.get_rect(midbottom=(x, y))  # position initiale
+        self.rect.size = image_surface.get_size()
+        self.rect.midbottom = (x, y)                  # position initiale
         self.speed = speed                            # vitesse verticale (négative = monte)
+        self.pos_y = float(self.rect.y)               # position continue (dt fractionnaire)
+        self.prev = self.rect.topleft                 # position avant la dernière mise à jour
+
+    def update(self, dt=1):
+        """Met à jour la position de la balle (dt = durée du pas en frames de référence)."""
+        self.update_all((self,), dt)
 
-    def update(self, *_):
-        """Met à jour la position de la balle à chaque frame."""
-        self.rect.y += self.speed                     # déplace la balle verticalement
-        if self.rect.bottom < 0:                      # si elle sort de l’écran par le haut
-            self.kill()                               # on la supprime (pour libérer mémoire)
+    @staticmethod
+    def update_all(bullets, dt=1, linger=False):
+        """Met à jour toutes les balles d’un groupe (une boucle, pas un appel par balle).
+
+        linger : une balle sortie de l’écran n’est retirée qu’au pas suivant, pour que les
+                 collisions continues testent encore le trajet du pas où elle est sortie.
+        """
+        for b in list(bullets):                       # copie : kill() modifie le groupe
+            rect = b.rect
+            if linger and rect.bottom < 0:            # sortie au pas précédent
+                b.kill()
+                continue
+            b.prev = rect.topleft
+            b.pos_y += b.speed * dt                   # déplace la balle verticalement
+            rect.y = int(b.pos_y)
+            if rect.bottom < 0 and not linger:        # si elle sort de l’écran par le haut
+                b.kill()                              # elle retourne au pool
 
 
 # ---------------------------------------------------------------
 # Classe représentant un ennemi
 # ---------------------------------------------------------------
 class Enemy(pygame.sprite.Sprite):
+    mask = None                                      # masque de l’image (collisions au pixel)
+
     def __init__(self, x, y, image_surface):
         super().__init__()
         self.image = image_surface                    # image de l’ennemi
-        self.rect = self.image.get_rect(topleft=(x, y))  # position initiale
+        self._rect = self.image.get_rect(topleft=(x, y))  # position initiale
+        self.fleet = None                             # formation d’appartenance (Fleet.add)
+        self.local_rect = None                        # emplacement fixe dans la formation
+
+    @property
+    def rect(self):
+        """Position à l’écran : origine de la flotte + emplacement local (calculée à la lecture)."""
+        fleet = self.fleet
+        if fleet is not None:
+            self._rect.topleft = (int(fleet.x) + self.local_rect.x, int(fleet.y) + self.local_rect.y)
+        return self._rect
+
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
+
+    def kill(self):
+        """Supprime l’ennemi des groupes et libère son emplacement dans la flotte."""
+        if self.fleet is not None:
+            self.fleet.remove(self)
+        super().kill()
 
 
 # ---------------------------------------------------------------
 # Classe représentant une balle ennemie avec un mouvement sinusoïdal
 # ---------------------------------------------------------------
-class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, speed=4, amp=60, freq=1.2, phase=0.0, drift=0.0):
+class EnemyBullet(PooledSprite):
+    shared_image = None                              # une seule Surface pour toutes les balles
+    mask = None                                      # masque de l’image (collisions au pixel)
+    trajectories = TrajectoryCache()                 # décalages sinusoïdaux partagés (LRU)
+
+    def __init__(self, x=0, y=0, speed=4, amp=60, freq=1.2, phase=0.0, drift=0.0):
         """
         speed : vitesse verticale (px/frame)
         amp   : amplitude horizontale du mouvement sinusoïdal
@@ -62,10 +164,22 @@ class EnemyBullet(pygame.sprite.Sprite):
         drift : dérive horizontale constante
         """
         super().__init__()
-        # Crée une simple forme rouge pour la balle ennemie
-        self.image = pygame.Surface((4, 12), pygame.SRCALPHA)
-        self.image.fill((220, 80, 80))
-        self.rect = self.image.get_rect(midtop=(x, y))
+        if EnemyBullet.shared_image is None:               # (Game la prend dans son atlas)
+            EnemyBullet.shared_image = EnemyBullet.make_image()
+        self.image = EnemyBullet.shared_image
+        self.rect = self.image.get_rect()
+        self.spawn(x, y, speed, amp, freq, phase, drift)
+
+    @staticmethod
+    def make_image(size=(4, 12), color=(220, 80, 80)):
+        """Crée une simple forme rouge pour la balle ennemie."""
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.fill(color)
+        return image
+
+    def spawn(self, x, y, speed=4, amp=60, freq=1.2, phase=0.0, drift=0.0):
+        """(Ré)initialise la balle : à la création et à chaque sortie du pool."""
+        self.rect.midtop = (x, y)
 
         # Paramètres de mouvement
         self.speed = speed
@@ -76,218 +190,713 @@ class EnemyBullet(pygame.sprite.Sprite):
 
         # Variables continues (pour éviter les erreurs d'arrondi)
         self.spawn_x = float(x)
-        self.pos_y = float(y)
-        self.t = 0.0                                 # temps écoulé
-        self.omega = 2.0 * math.pi * self.freq       # pulsation angulaire (2πf)
-
-    def update(self, *_):
-        """Mise à jour du mouvement de la balle ennemie."""
-        self.t += 1.0 / FPS                          # incrémente le temps simulé
-        self.pos_y += self.speed                     # avance verticalement (descend)
-        # Mouvement sinusoïdal sur X + dérive
-        x = self.spawn_x + self.amp * math.sin(self.phase + self.omega * self.t) + self.drift * (self.t * FPS)
-        # Mise à jour de la position réelle sur l’écran
-        self.rect.y = int(self.pos_y)
-        self.rect.centerx = int(x)
-        # Si la balle sort de l’écran → suppression
-        if self.rect.top > HEIGHT or self.rect.right < -40 or self.rect.left > WIDTH + 40:
-            self.kill()
+        self.spawn_y = float(y)
+        self.k = 0                                   # pas simulés depuis le tir
+        self.path = None                             # table de trajectoire (liée au 1er pas)
+        self.exit_k = None                           # pas de sortie d’écran (None = tester les bords)
+        self.prev = self.rect.topleft                # position avant la dernière mise à jour
+
+    def update(self, dt=1):
+        """Mise à jour du mouvement de la balle ennemie (dt en frames de référence)."""
+        self.update_all((self,), dt)
+
+    @staticmethod
+    def update_all(bullets, dt=1, linger=False):
+        """Met à jour toutes les balles ennemies d’un groupe en une seule boucle.
+
+        Le mouvement sinusoïdal est lu dans une table partagée (EnemyBullet.trajectories)
+        et chaque balle connaît dès son premier pas celui où elle quitte l’écran.
+        linger : retrait un pas plus tard (voir Bullet.update_all).
+        """
+        cache = EnemyBullet.trajectories
+        late = 1 if linger else 0
+        for b in list(bullets):                      # copie : kill() modifie le groupe
+            rect = b.rect
+            if linger and b.exit_k is None and (rect.top > HEIGHT or rect.right < -40
+                                                or rect.left > WIDTH + 40):
+                b.kill()                             # sortie au pas précédent
+                continue
+            b.prev = rect.topleft
+            path = b.path
+            if path is None:                         # premier pas : table + pas de sortie
+                path = b.path = cache.get(b.amp, b.freq, b.phase, b.drift, dt, FPS)
+                b.exit_k = path.exit_step(b.spawn_x, b.spawn_y, b.speed * dt, rect.width,
+                                          WIDTH, HEIGHT)
+            k = b.k = b.k + 1
+            if b.exit_k is not None and k == b.exit_k + late:  # sortie prévue → suppression
+                b.kill()
+                continue
+            # Mouvement sinusoïdal sur X + dérive (table), descente verticale
+            rect.y = int(b.spawn_y + k * (b.speed * dt))
+            if b.exit_k is None:                     # balle qui ne descend pas : test des bords
+                rect.centerx = int(path.x(b.spawn_x, k))
+                if not linger and (rect.top > HEIGHT or rect.right < -40 or rect.left > WIDTH + 40):
+                    b.kill()
+            elif path.drift_x is None:               # table déjà calculée jusqu’à exit_k
+                rect.centerx = int(b.spawn_x + path.sin[k - 1])
+            else:
+                rect.centerx = int(b.spawn_x + path.sin[k - 1] + path.drift_x[k - 1])
 
 
 # ---------------------------------------------------------------
 # Classe représentant le joueur
 # ---------------------------------------------------------------
 class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y, image_surface, speed=5):
+    mask = None                                      # masque de l’image (collisions au pixel)
+
+    def __init__(self, x, y, image_surface, speed=5, shoot_cooldown=250):
         super().__init__()
         self.image = image_surface                    # image du joueur (vaisseau)
         self.rect = self.image.get_rect(midbottom=(x, y))
         self.speed = speed                            # vitesse horizontale
-        self.shoot_cooldown = 250                     # temps minimal entre deux tirs (en ms)
+        self.shoot_cooldown = shoot_cooldown          # temps minimal entre deux tirs (en ms)
         self.last_shot = 0                            # dernier tir enregistré
         self.lives = 3                                # nombre de vies restantes
-
-    def update(self, keys):
-        """Gère le déplacement du joueur à chaque frame."""
-        if keys[pygame.K_LEFT]:                       # touche flèche gauche
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT]:                      # touche flèche droite
-            self.rect.x += self.speed
+        self.pos_x = float(self.rect.x)               # position continue (dt fractionnaire)
+        self.prev = self.rect.topleft                 # position avant la dernière mise à jour
+        self.actions = 0                              # masque ACTION_* du pas en cours
+
+    def control(self, actions):
+        """Reçoit le masque d’actions du pas (seul sprite piloté par les entrées)."""
+        self.actions = actions
+
+    def update(self, dt=1):
+        """Gère le déplacement du joueur (dt en frames de référence)."""
+        self.prev = self.rect.topleft
+        actions = self.actions
+        if actions & ACTION_LEFT:                     # flèche gauche (ou bot)
+            self.pos_x -= self.speed * dt
+        if actions & ACTION_RIGHT:                    # flèche droite (ou bot)
+            self.pos_x += self.speed * dt
         # Empêche le joueur de sortir de l’écran
-        self.rect.left = max(self.rect.left, 0)
-        self.rect.right = min(self.rect.right, WIDTH)
+        self.pos_x = min(max(self.pos_x, 0), WIDTH - self.rect.width)
+        self.rect.x = int(self.pos_x)
 
-    def can_shoot(self):
-        """Vérifie si le joueur peut tirer (cooldown écoulé)."""
-        return pygame.time.get_ticks() - self.last_shot >= self.shoot_cooldown
+    @staticmethod
+    def update_all(players, dt=1):
+        for p in players:
+            p.update(dt)
 
-    def shoot(self, bullets_group, all_sprites_group, bullet_image):
-        """Crée une balle si le cooldown le permet."""
-        if self.can_shoot():
-            bullet = Bullet(self.rect.centerx, self.rect.top, bullet_image)
+    def can_shoot(self, now=None):
+        """Vérifie si le joueur peut tirer (cooldown écoulé).
+
+        now : horloge en ms (par défaut pygame.time.get_ticks()) ; le mode headless
+              passe son horloge simulée pour ne pas dépendre du temps réel.
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        return now - self.last_shot >= self.shoot_cooldown
+
+    def shoot(self, bullets_group, all_sprites_group, bullet_image, now=None, pool=None):
+        """Crée une balle si le cooldown le permet (prise dans pool s’il est fourni)."""
+        if now is None:
+            now = pygame.time.get_ticks()
+        if self.can_shoot(now):
+            if pool is not None:
+                bullet = pool.acquire(self.rect.centerx, self.rect.top, bullet_image)
+            else:
+                bullet = Bullet(self.rect.centerx, self.rect.top, bullet_image)
             bullets_group.add(bullet)
             all_sprites_group.add(bullet)
-            self.last_shot = pygame.time.get_ticks()
+            self.last_shot = now
 
 
 # ---------------------------------------------------------------
 # Classe principale du jeu
 # ---------------------------------------------------------------
 class Game:
-    def __init__(self):
-        """Initialisation de la fenêtre, police, et lancement."""
+    def __init__(self, headless=False, vectorized_bullets=False, dirty_rects=False,
+                 seed=None, recorder=None, sim_hz=FPS, render_fps=FPS, profile=False,
+                 waves=None, endless=False, spawn_per_frame=SPAWN_PER_FRAME, controls=None,
+                 swept_collisions=None, tuning=None, pixel_collisions=True):
+        """Initialisation de la fenêtre, police, et lancement.
+
+        headless : si True, aucune fenêtre n'est ouverte (rendu dans une Surface hors écran),
+                   pas de vsync ni de limite de FPS, et l'horloge du jeu est simulée
+                   (1 frame = 1000 / FPS ms) : on peut enchaîner des milliers de parties.
+        vectorized_bullets : si True, les balles ennemies sont gérées en tableaux NumPy
+                   (EnemyBulletArrays) au lieu d'un sprite EnemyBullet par balle.
+        dirty_rects : si True, rendu par zones modifiées : seul le fond sous les sprites
+                   qui bougent est restauré, et seules ces zones sont envoyées à l'écran
+                   (pygame.display.update(rects) au lieu de flip()).
+        seed     : graine du générateur aléatoire du jeu (None = tirée au hasard) ; avec la
+                   même graine et les mêmes entrées, une session est rejouée à l'identique.
+        recorder : replay.Recorder qui enregistre les entrées de chaque frame de run().
+        sim_hz   : fréquence fixe de la simulation (mises à jour par seconde) dans run() ;
+                   chaque mise à jour avance de dt = FPS / sim_hz frames de référence.
+        render_fps : cadence maximale du rendu dans run() (0 = aussi vite que possible) ;
+                   le rendu interpole entre les deux derniers états de la simulation.
+        profile  : si True, chronomètre chaque phase de la boucle (self.profiler) ;
+                   F3 affiche l'overlay des percentiles. profile="trace" garde en plus
+                   une trace par frame (profiler.export_csv / export_json).
+        waves    : dispositions des vagues (fichiers .wave ou waves.Wave), jouées dans
+                   l'ordre ; None = layouts/*.wave. Une vague détruite lance la suivante.
+        endless  : après la dernière disposition, vagues générées sans fin.
+        spawn_per_frame : ennemis créés au plus par frame ; une grande vague apparaît
+                   sur plusieurs frames au lieu de bloquer la frame où elle commence.
+        controls : controls.Controls qui traduit le clavier en actions dans run()
+                   (touches remappables, tir automatique) ; None = touches par défaut.
+        swept_collisions : si True, les balles sont testées sur tout leur trajet du pas
+                   (swept AABB) et ne traversent plus leur cible quand un pas est grand ;
+                   None = automatique, activé dès que sim_hz < FPS (dt > 1).
+        tuning   : réglages d’équilibrage qui remplacent ceux de BALANCE (cadence de tir,
+                   vitesses, facteurs de la flotte, balles ennemies) ; pris en compte
+                   à chaque reset().
+        pixel_collisions : si True, les rects qui se chevauchent sont confirmés par les
+                   masques des images (précalculés dans l’atlas) : une balle qui passe
+                   dans le vide autour du vaisseau ne touche plus, y compris avec les
+                   collisions continues (masques testés le long du trajet du pas).
+        """
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))  # création de la fenêtre
-        pygame.display.set_caption("Mini Space Invaders")        # titre de la fenêtre
+        self.headless = headless
+        if vectorized_bullets and not HAS_NUMPY:
+            print("[⚠] numpy introuvable : balles ennemies gérées en sprites")
+            vectorized_bullets = False
+        self.vectorized_bullets = vectorized_bullets
+        self.dirty_rects = dirty_rects
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 64)
+        self.seed = seed
+        self.rng = random.Random(seed)                           # hasard du jeu (déterministe)
+        self.tuning = dict(BALANCE)                              # réglages d’équilibrage
+        for key, value in (tuning or {}).items():
+            if key not in BALANCE:
+                raise ValueError(f"réglage d’équilibrage inconnu : {key!r}")
+            self.tuning[key] = value
+        self.recorder = recorder
+        self.controls = controls if controls is not None else Controls()  # clavier -> actions
+        if headless:
+            self.screen = pygame.Surface((WIDTH, HEIGHT))        # écran virtuel (pas de fenêtre)
+        else:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))  # création de la fenêtre
+            pygame.display.set_caption("Mini Space Invaders")    # titre de la fenêtre
         self.clock = pygame.time.Clock()                         # horloge interne pour FPS
+        self.sim_hz = sim_hz                                     # mises à jour par seconde
+        self.dt = FPS / sim_hz                                   # durée d’un pas (frames de réf.)
+        if swept_collisions is None:
+            swept_collisions = self.dt > 1
+        self.swept_collisions = swept_collisions                 # collisions sur le trajet du pas
+        self.collider = MaskCollider() if pixel_collisions else None  # phase fine (masques)
+        self.render_fps = render_fps                             # limite du rendu (0 = aucune)
+        if profile:
+            self.profiler = FrameProfiler(trace=profile == "trace")
+        else:
+            self.profiler = NullProfiler()                       # sections sans effet
+        self.show_profiler = False                               # overlay affiché (F3)
+        self.focused = True                                      # fenêtre active (sinon pause)
+        self.frame = 0                                           # nombre de frames simulées
+        self.sim_fps = 0.0                                       # frames simulées / seconde (headless)
         self.font = pygame.font.SysFont("comicsans", 30)         # police pour le texte
+        self.text = TextCache(self.font)                         # textes rendus (cache LRU)
+        self.atlas = self.build_atlas()                          # images des sprites + masques
+        EnemyBullet.shared_image = self.atlas["enemy_bullet"]    # avant de remplir le pool
+        Bullet.mask = self.atlas.mask("player_bullet")           # masques partagés par image
+        Enemy.mask = self.atlas.mask("enemy")
+        EnemyBullet.mask = self.atlas.mask("enemy_bullet")
+        Player.mask = self.atlas.mask("player")
+        self.bullet_pool = SpritePool(Bullet, 16)                # balles du joueur préallouées
+        self.enemy_bullet_pool = SpritePool(EnemyBullet, 64)     # balles ennemies préallouées
+        self.waves = WaveSequence(waves, endless, self.rng, WIDTH, HEIGHT)  # lues une fois
+        self.spawn_per_frame = spawn_per_frame
+        self.scheduler = UpdateScheduler()                       # routines de mise à jour
+        if recorder is not None and recorder.options is None:
+            recorder.options = self.sim_options()                # en-tête du journal
         self.reset()                                             # initialisation du contenu du jeu
 
     # --- Fonction utilitaire ---
     def load_image(self, filename, size=None, colorkey=None):
-        """Charge une image depuis le dossier assets, gère erreurs et redimensionnement."""
-        path = ASSETS / filename
-        if not path.exists():                                    # si le fichier n’existe pas
-            print(f"[⚠] Fichier introuvable : {path}")
-            surf = pygame.Surface(size or (50, 50))              # carré rouge par défaut
-            surf.fill(RED)
-            return surf
-        img = pygame.image.load(path).convert()                  # charge l’image
-        if colorkey is not None:
-            img.set_colorkey(colorkey)                           # rend une couleur transparente
-        if size:
-            img = pygame.transform.smoothscale(img, size)        # redimensionne si demandé
-        return img
+        """Charge une image depuis le dossier assets, gère erreurs et redimensionnement.
+
+        Passe par ASSET_MANAGER : chaque image n’est décodée qu’une fois par processus.
+        """
+        return ASSET_MANAGER.load(filename, size, colorkey)
+
+    def build_atlas(self):
+        """Range les images des sprites dans un atlas (alpha par pixel, format de l’écran)."""
+        atlas = SpriteAtlas()
+        atlas.add("player", self.load_image("PLayer.jpg", (60, 60)), colorkey=WHITE)
+        atlas.add("enemy", self.load_image("vaisseau.jpg", (40, 25)))
+        atlas.add("player_bullet", self.load_image("red.jpg", (8, 24)))
+        atlas.add("enemy_bullet", EnemyBullet.make_image())
+        return atlas.build()
 
     def reset(self):
         """Réinitialise le jeu (nouvelle partie)."""
+        # Les balles de la partie précédente retournent dans leurs pools
+        for group in (getattr(self, "bullets", ()), getattr(self, "enemy_bullets", ())):
+            if isinstance(group, pygame.sprite.Group):
+                for spr in group.sprites():
+                    spr.kill()
+
         # Groupes de sprites (gestion automatique)
-        self.all_sprites = pygame.sprite.Group()                 # tous les éléments à dessiner
+        if self.dirty_rects:                                     # tous les éléments à dessiner
+            self.all_sprites = pygame.sprite.RenderUpdates()     # (draw() renvoie les zones modifiées)
+        else:
+            self.all_sprites = pygame.sprite.Group()
+        self._full_redraw = True                                 # 1re frame : écran complet
+        self._bullet_rects = []                                  # zones des balles vectorisées
+        self._hud_rects = []                                     # zones du HUD à l’écran
+        self._hud_key = None                                     # valeurs affichées par le HUD
         self.bullets = pygame.sprite.Group()                     # balles du joueur
         self.enemies = pygame.sprite.Group()                     # ennemis
-        self.enemy_bullets = pygame.sprite.Group()               # balles ennemies
+        if self.vectorized_bullets:                              # balles ennemies
+            self.enemy_bullets = EnemyBulletArrays(WIDTH, HEIGHT, FPS,
+                                                   image=self.atlas["enemy_bullet"])
+        else:
+            self.enemy_bullets = pygame.sprite.Group()
 
-        # --- Chargement des images depuis /assets ---
+        # --- Images : fond depuis /assets, sprites depuis l’atlas ---
         self.background = self.load_image("Fond.jpg", (WIDTH, HEIGHT))
-        self.player_img = self.load_image("PLayer.jpg", (60, 60), WHITE)
-        self.enemy_img = self.load_image("vaisseau.jpg", (40, 25))
-        self.player_bullet_img = self.load_image("red.jpg", (8, 24))
+        atlas = self.atlas
+        self.player_img = atlas["player"]
+        self.enemy_img = atlas["enemy"]
+        self.player_bullet_img = atlas["player_bullet"]
 
         # --- Création du joueur ---
-        self.player = Player(WIDTH // 2, HEIGHT - 30, self.player_img)
+        tuning = self.tuning
+        self.player = Player(WIDTH // 2, HEIGHT - 30, self.player_img,
+                             tuning["player_speed"], tuning["shoot_cooldown"])
         self.all_sprites.add(self.player)
 
-        # --- Génération de trois rangées d’ennemis ---
-        for i in range(9):
-            e = Enemy(60 + i * 80, 80, self.enemy_img)
-            self.enemies.add(e)
-            self.all_sprites.add(e)
-        for i in range(7):
-            h = Enemy(140 + i * 80, 120, self.enemy_img)
-            self.enemies.add(h)
-            self.all_sprites.add(h)
-        for i in range(5):
-            h = Enemy(220 + i * 80, 160, self.enemy_img)
-            self.enemies.add(h)
-            self.all_sprites.add(h)
-
-        # --- Variables de contrôle de flotte ---
-        self.fleet_dir = 1       # direction (1 = droite, -1 = gauche)
-        self.fleet_speed = 1     # vitesse horizontale
-        self.drop_amount = 15    # descente après rebond sur un bord
+        # --- Systèmes de mise à jour : seuls les objets qui bougent d’eux-mêmes ---
+        # (les ennemis, déplacés en bloc par la flotte, ne sont jamais visités)
+        scheduler = self.scheduler
+        scheduler.clear()
+        scheduler.add("player", Player.update_all, (self.player,))
+        linger = self.swept_collisions                           # collisions sur le pas de sortie
+        scheduler.add("bullets", partial(Bullet.update_all, linger=linger), self.bullets)
+        if self.vectorized_bullets:                              # toutes les balles d’un coup
+            self.enemy_bullets.linger = linger
+            scheduler.add("enemy_bullets", EnemyBulletArrays.update, self.enemy_bullets, sprites=False)
+        else:
+            scheduler.add("enemy_bullets", partial(EnemyBullet.update_all, linger=linger),
+                          self.enemy_bullets)
+
+        # --- Première vague d’ennemis ---
+        self.waves.reset()
+        self.start_wave(self.waves.next())
+
         self.state = PLAYING     # état du jeu
         self.score = 0           # score du joueur
 
+    def start_wave(self, wave):
+        """Lance une vague : nouvelle formation vide, réglages de la vague, premier lot d’ennemis."""
+        self.wave = wave
+        self.fleet = Fleet()                                     # formation (positions des ennemis)
+        self.fleet_prev = (0, 0)                                 # origine avant la dernière mise à jour
+        self.fleet_dir = 1                                       # direction (1 = droite, -1 = gauche)
+        self.fleet_speed = wave.speed * self.tuning["fleet_speed"]  # vitesse horizontale
+        self.drop_amount = wave.drop * self.tuning["drop"]       # descente après rebond sur un bord
+        self._spawn_next = 0                                     # prochain emplacement à peupler
+        self.spawn_enemies()
+
+    @property
+    def spawning(self):
+        """True tant que des ennemis de la vague en cours restent à créer."""
+        return self._spawn_next < len(self.wave.slots)
+
+    def spawn_enemies(self):
+        """Crée le lot suivant d’ennemis de la vague (au plus spawn_per_frame)."""
+        fleet, img = self.fleet, self.enemy_img
+        ox, oy = int(fleet.x), int(fleet.y)                      # la formation a pu bouger
+        start = self._spawn_next
+        end = min(len(self.wave.slots), start + self.spawn_per_frame)
+        for x, y in self.wave.slots[start:end]:
+            e = Enemy(ox + x, oy + y, img)
+            self.enemies.add(e)
+            self.all_sprites.add(e)
+            fleet.add(e)
+        self._spawn_next = end
+
+    def sim_options(self):
+        """Options de Game dont dépend le déroulement d’une partie (en-tête des replays)."""
+        waves = [dict(vars(w), slots=[list(s) for s in w.slots]) for w in self.waves.waves]
+        return {"sim_hz": self.sim_hz, "waves": waves, "endless": self.waves.endless,
+                "spawn_per_frame": self.spawn_per_frame,
+                "swept_collisions": self.swept_collisions,
+                "pixel_collisions": self.collider is not None, "tuning": dict(self.tuning)}
+
+    def snapshot(self):
+        """État complet de la simulation sous forme de bytes compacts (voir snapshot.py)."""
+        return snapshot.save(self)
+
+    def restore(self, blob):
+        """Revient à l’état d’un instantané pris par snapshot() sur cette partie."""
+        snapshot.restore(self, blob)
+
+    def now(self):
+        """Horloge du jeu en ms, dérivée du nombre de pas (1 pas = 1000 / sim_hz ms).
+
+        Elle ne dépend pas du temps réel : une session rejouée (ou simulée en headless)
+        voit exactement les mêmes cooldowns que la partie d’origine.
+        """
+        return self.frame * 1000 // self.sim_hz
+
+    def step(self, actions=0):
+        """Avance la simulation d’une frame avec le masque d’actions donné (API headless).
+
+        Renvoie l’état du jeu (PLAYING ou GAME_OVER) après la frame.
+        """
+        if self.state == GAME_OVER and actions & ACTION_RESTART:
+            self.reset()
+        if self.state == PLAYING and actions & ACTION_FIRE:
+            self.player.shoot(self.bullets, self.all_sprites, self.player_bullet_img, self.now(),
+                              self.bullet_pool)
+        self.update(actions)
+        return self.state
+
+    def run_headless(self, max_frames, policy=None, render=False):
+        """Simule jusqu’à max_frames frames aussi vite que possible (ou jusqu’au Game Over).
+
+        policy : fonction game -> masque d’actions appelée à chaque frame (None = aucune action)
+        render : si True, dessine aussi chaque frame dans l’écran virtuel
+        Renvoie le nombre de frames simulées par seconde (aussi stocké dans self.sim_fps).
+        """
+        frames = 0
+        start = time.perf_counter()
+        prof = self.profiler
+        while frames < max_frames and self.state == PLAYING:
+            with prof.section("update"):
+                self.step(policy(self) if policy else 0)
+            if render:
+                with prof.section("draw"):
+                    self.draw()
+            prof.end_frame()
+            frames += 1
+        elapsed = time.perf_counter() - start
+        self.sim_fps = frames / elapsed if elapsed > 0 else float("inf")
+        return self.sim_fps
+
     def run(self):
-        """Boucle principale du jeu : tourne à l’infini jusqu’à fermeture."""
+        """Boucle principale du jeu : tourne à l’infini jusqu’à fermeture.
+
+        Pas de temps fixe : le temps réel écoulé s’accumule, et la simulation avance
+        par pas de 1000 / sim_hz ms tant qu’il en reste ; le rendu interpole ensuite
+        entre les deux derniers états. Un rendu très lent (chargement, fenêtre déplacée)
+        ne déclenche pas une avalanche de mises à jour : l’accumulateur est borné
+        (MAX_FRAME_MS) et au plus MAX_STEPS_PER_FRAME pas sont joués par rendu.
+
+        Quand rien ne bouge (Game Over, fenêtre sans focus), la boucle ne tourne plus :
+        voir wait_idle().
+        """
+        step_ms = 1000.0 / self.sim_hz
+        acc = 0.0                     # temps réel pas encore simulé (ms)
         while True:
-            self.clock.tick(FPS)      # limite à FPS images/seconde
-            self.handle_events()      # gestion des touches et événements
-            self.update()             # mise à jour des positions et collisions
-            self.draw()               # affichage à l’écran
-
-    def handle_events(self):
-        """Gère les entrées clavier et la fermeture."""
-        for event in pygame.event.get():
+            if self.idle:
+                self.wait_idle()
+                self.clock.tick()     # le temps passé à attendre n’est pas simulé
+                acc = 0.0
+            acc += min(self.clock.tick(self.render_fps), MAX_FRAME_MS)
+            with self.profiler.section("events"):
+                self.handle_events()  # gestion des touches et événements
+            steps = 0
+            while acc >= step_ms and steps < MAX_STEPS_PER_FRAME:
+                actions = self.controls.snapshot()   # entrées du pas (événements reçus)
+                if self.recorder is not None:
+                    self.recorder.record(actions)   # une frame d’entrées dans le journal
+                with self.profiler.section("update"):
+                    self.step(actions)   # mise à jour des positions et collisions
+                acc -= step_ms
+                steps += 1
+            if steps == MAX_STEPS_PER_FRAME:
+                acc = min(acc, step_ms)   # retard abandonné : on ne rattrape pas
+            with self.profiler.section("draw"):
+                self.draw(acc / step_ms)  # affichage interpolé à l’écran
+            self.profiler.end_frame()
+
+    @property
+    def idle(self):
+        """True si l’écran est figé : Game Over (sans rejouer demandé) ou fenêtre sans focus."""
+        if not self.focused:
+            return True
+        return self.state == GAME_OVER and not self.controls.pressed & ACTION_RESTART
+
+    def wait_idle(self):
+        """Écran figé : un seul rendu, puis attente bloquante des événements (aucun calcul
+        ni affichage entre deux) jusqu’à ce que le jeu reprenne (rejouer, focus retrouvé)."""
+        self.draw()
+        while self.idle:
+            event = pygame.event.wait(IDLE_WAIT_MS)  # NOEVENT au bout du délai
+            if event.type == pygame.NOEVENT:
+                continue
+            self.handle_events([event, *pygame.event.get()])
+            if self._full_redraw:                   # fenêtre réaffichée, overlay F3...
+                self.draw()
+
+    def handle_events(self, events=None):
+        """Gère les entrées clavier, le focus de la fenêtre et la fermeture."""
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:               # clic sur la croix rouge
+                if self.recorder is not None:
+                    self.recorder.close()
                 pygame.quit()
                 sys.exit()
 
-            # Tir du joueur
-            if self.state == PLAYING and event.type == pygame.KEYDOWN and event.key == pygame.K_a:
-                self.player.shoot(self.bullets, self.all_sprites, self.player_bullet_img)
+            # Déplacement, tir, rejouer : masque d’actions lu par run() à chaque pas
+            if self.controls.handle(event):
+                continue
 
-            # Rejouer en cas de Game Over
-            if self.state == GAME_OVER and event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                self.reset()
+            # Fenêtre en arrière-plan : partie en pause jusqu’au retour du focus
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED):
+                self.focused = event.type == pygame.WINDOWFOCUSGAINED
+            elif event.type == pygame.WINDOWEXPOSED:    # contenu de la fenêtre à redessiner
+                self._full_redraw = True
 
-    def update(self):
-        """Met à jour les objets du jeu (positions, collisions, logique)."""
-        keys = pygame.key.get_pressed()                 # récupère l’état du clavier
+            # F3 : affiche / masque l’overlay du profileur (si Game(profile=True))
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and self.profiler.enabled:
+                self.show_profiler = not self.show_profiler
+                self._full_redraw = True
+
+    def update(self, actions=0):
+        """Met à jour les objets du jeu (positions, collisions, logique).
+
+        actions : masque ACTION_* du pas (clavier via Controls, bot, replay...).
+        """
+        self.frame += 1                                 # une frame de plus sur l’horloge du jeu
         if self.state != PLAYING:                      # si pas en jeu, ne rien faire
             return
 
-        self.all_sprites.update(keys)                  # met à jour tous les sprites
-
-        # Déplacement horizontal de la flotte ennemie
-        edge_hit = False
-        for e in self.enemies:
-            e.rect.x += self.fleet_dir * self.fleet_speed
-            if e.rect.right >= WIDTH - 5 or e.rect.left <= 5:
-                edge_hit = True                        # bord atteint
-        if edge_hit:
-            self.fleet_dir *= -1                       # inverse la direction
-            for e in self.enemies:
-                e.rect.y += self.drop_amount           # descend les ennemis d’un cran
-
-        # Gestion des collisions balles ↔ ennemis
-        hits = pygame.sprite.groupcollide(self.enemies, self.bullets, True, True)
-        self.score += len(hits) * 10                   # +10 points par ennemi touché
-
-        # Si un ennemi atteint le bas → fin de partie
-        for e in self.enemies:
-            if e.rect.bottom >= HEIGHT - 40 or e.rect.colliderect(self.player.rect):
+        prof = self.profiler
+        dt = self.dt
+        with prof.section("sprites"):
+            self.player.control(actions)               # seul le joueur reçoit les entrées
+            self.scheduler.run(dt, self.all_sprites)   # joueur, balles, balles ennemies
+
+        # Déplacement horizontal de la flotte ennemie : seule l’origine bouge, et les
+        # bords de la formation sont en cache (coût constant quelle que soit la flotte)
+        fleet = self.fleet
+        with prof.section("fleet"):
+            if self.spawning:
+                self.spawn_enemies()                   # suite de la vague en cours
+            self.fleet_prev = (fleet.x, fleet.y)       # pour l’interpolation du rendu
+            if fleet:
+                fleet.move(self.fleet_dir * self.fleet_speed * dt, 0)
+                if fleet.right >= WIDTH - 5 or fleet.left <= 5:   # bord atteint
+                    self.fleet_dir *= -1               # inverse la direction
+                    fleet.move(0, self.drop_amount)    # descend la flotte d’un cran
+
+        # Gestion des collisions balles ↔ ennemis (grande flotte : grille spatiale locale,
+        # chaque balle n’est testée que contre les ennemis de ses cellules)
+        with prof.section("groupcollide"):
+            if self.swept_collisions:
+                fleet_delta = (int(fleet.x) - int(self.fleet_prev[0]), int(fleet.y) - int(self.fleet_prev[1]))
+                hits = swept.fleet_collide(fleet, self.bullets, fleet_delta, self.collider)
+            elif len(fleet) >= SPATIAL_HASH_MIN_ENEMIES:
+                hits = fleet.groupcollide(self.bullets, True, True, self.collider)
+            elif self.collider is not None:
+                hits = self.collider.groupcollide(self.enemies, self.bullets, True, True)
+            else:
+                hits = pygame.sprite.groupcollide(self.enemies, self.bullets, True, True)
+            self.score += len(hits) * 10               # +10 points par ennemi touché
+
+            # Si un ennemi atteint le bas ou touche le joueur → fin de partie
+            if fleet and (fleet.bottom >= HEIGHT - 40 or self.fleet_touches_player()):
                 self.state = GAME_OVER
 
-        # Si plus d’ennemis → victoire
-        if not self.enemies:
-            self.state = GAME_OVER
-
-        # Tir aléatoire d’un ennemi
-        if self.enemies and random.random() < max(0.002, 0.05 * len(self.enemies) / 30.0):
-            shooter = random.choice(self.enemies.sprites())
-            b = EnemyBullet(shooter.rect.centerx, shooter.rect.bottom)
-            self.enemy_bullets.add(b)
-            self.all_sprites.add(b)
+        # Vague détruite → vague suivante (plus de vague → victoire)
+        if not self.enemies and not self.spawning:
+            wave = self.waves.next()
+            if wave is None:
+                self.state = GAME_OVER
+            else:
+                self.start_wave(wave)
+
+        # Tir aléatoire d’un ennemi de la ligne de front
+        with prof.section("enemy_fire"):
+            wave, tuning = self.wave, self.tuning
+            p_fire = max(wave.fire_min, wave.fire * len(self.enemies) / 30.0)  # par frame de réf.
+            p_fire = min(1.0, p_fire * tuning["fire"])
+            if dt != 1:
+                p_fire = 1.0 - (1.0 - p_fire) ** dt     # même cadence de tir pour tout sim_hz
+            if self.enemies and self.rng.random() < p_fire:
+                shooter = self.fleet.shooter(self.rng)           # ligne de front, O(1)
+                x, y = shooter.rect.centerx, shooter.rect.bottom
+                speed, amp, freq = tuning["bullet_speed"], tuning["bullet_amp"], tuning["bullet_freq"]
+                if self.vectorized_bullets:
+                    self.enemy_bullets.spawn(x, y, speed, amp, freq)
+                else:
+                    b = self.enemy_bullet_pool.acquire(x, y, speed, amp, freq)
+                    self.enemy_bullets.add(b)
+                    self.all_sprites.add(b)
 
         # Collision balle ennemie ↔ joueur
-        if pygame.sprite.spritecollide(self.player, self.enemy_bullets, True):
+        with prof.section("spritecollide"):
+            player = self.player
+            if self.swept_collisions and self.vectorized_bullets:
+                delta = (player.rect.x - player.prev[0], player.rect.y - player.prev[1])
+                mask = player.mask if self.collider is not None else None
+                player_hit = self.enemy_bullets.collide_rect_swept(player.rect, delta, mask=mask)
+            elif self.swept_collisions:
+                player_hit = swept.sprite_collide(player, player.prev, self.enemy_bullets,
+                                                  collider=self.collider)
+            elif self.collider is not None and not self.vectorized_bullets:
+                player_hit = self.collider.spritecollide(self.player, self.enemy_bullets, True)
+            elif self.vectorized_bullets:
+                mask = self.player.mask if self.collider is not None else None
+                player_hit = self.enemy_bullets.collide_rect(self.player.rect, mask=mask)
+            else:
+                player_hit = pygame.sprite.spritecollide(self.player, self.enemy_bullets, True)
+        if player_hit:
             self.player.lives -= 1
             if self.player.lives <= 0:
                 self.state = GAME_OVER
 
-    def draw(self):
-        """Affiche tous les éléments à l’écran."""
-        self.screen.blit(self.background, (0, 0))       # affiche le fond
-        self.all_sprites.draw(self.screen)              # affiche les sprites
+    def fleet_touches_player(self):
+        """True si un ennemi touche le joueur (grille de la flotte, puis masques)."""
+        player, collider = self.player, self.collider
+        touching = self.fleet.collide_rect(player.rect)
+        if collider is None:
+            return bool(touching)
+        return any(collider(e, player) for e in touching)
+
+    def draw(self, alpha=1.0):
+        """Affiche tous les éléments à l’écran.
 
-        # --- HUD (interface) ---
-        score_surf = self.font.render(f"Score: {self.score}", True, WHITE)
-        lives_surf = self.font.render(f"Lives: {self.player.lives}", True, WHITE)
-        self.screen.blit(score_surf, (10, 10))
-        self.screen.blit(lives_surf, (WIDTH - 120, 10))
+        alpha : fraction du pas de simulation écoulée depuis la dernière mise à jour ;
+                les objets mobiles sont dessinés entre leur position précédente (0)
+                et leur position actuelle (1).
+        """
+        if alpha >= 1.0 or self.state != PLAYING:
+            self._draw(1.0)
+            return
+        moved = self.interpolate(alpha)
+        try:
+            self._draw(alpha)
+        finally:
+            for spr, pos in moved:                      # remet les positions simulées
+                spr.rect.topleft = pos
+            self.fleet.x, self.fleet.y = self._fleet_pos
+
+    def interpolate(self, alpha):
+        """Place temporairement les objets mobiles à leur position interpolée.
+
+        Renvoie [(sprite, position simulée)] pour les remettre en place après le dessin.
+        """
+        moved = []
+        sprites = [self.player, *self.bullets]
+        if not self.vectorized_bullets:
+            sprites += self.enemy_bullets.sprites()
+        for spr in sprites:
+            x, y = spr.rect.topleft
+            px, py = spr.prev
+            moved.append((spr, (x, y)))
+            spr.rect.topleft = (int(px + (x - px) * alpha), int(py + (y - py) * alpha))
+        fleet = self.fleet
+        self._fleet_pos = (fleet.x, fleet.y)
+        px, py = self.fleet_prev
+        fleet.x, fleet.y = px + (fleet.x - px) * alpha, py + (fleet.y - py) * alpha
+        return moved
+
+    def _draw(self, alpha):
+        """Dessin de la frame (positions déjà interpolées par draw())."""
+        if self.dirty_rects and not self._full_redraw:
+            self.draw_dirty(alpha)
+            return
+        prof = self.profiler
+        with prof.section("background"):
+            self.screen.blit(self.background, (0, 0))   # affiche le fond
+        with prof.section("sprite_draw"):
+            self.all_sprites.draw(self.screen)          # affiche les sprites
+            if self.vectorized_bullets:                 # surface partagée
+                self._bullet_rects = self.enemy_bullets.draw(self.screen, True, alpha)
+        with prof.section("hud"):
+            self._hud_rects = self.draw_hud()
+            self._hud_key = (self.score, self.player.lives, self.waves.number, self.state,
+                             self.focused)
+            if self.show_profiler:
+                self.profiler.draw_overlay(self.screen)
+                self._full_redraw = True                # overlay : pas de rendu par zones
+            else:
+                self._full_redraw = False
+
+        if not self.headless:
+            with prof.section("flip"):
+                pygame.display.flip()                   # met à jour l’écran
+
+    def draw_hud(self):
+        """Dessine le HUD (score, vies, message de fin) ; renvoie les rects dessinés."""
+        score_surf = self.text.render(f"Score: {self.score}", True, WHITE)
+        lives_surf = self.text.render(f"Lives: {self.player.lives}", True, WHITE)
+        wave_surf = self.text.render(f"Vague {self.waves.number}", True, WHITE)
+        rects = [self.screen.blit(score_surf, (10, 10)),
+                 self.screen.blit(lives_surf, (WIDTH - 120, 10)),
+                 self.screen.blit(wave_surf, wave_surf.get_rect(centerx=WIDTH // 2, top=10))]
 
         # Message de fin de partie
         if self.state == GAME_OVER:
-            msg = self.font.render("FIN : Appuie sur R pour recommencer", True, WHITE)
+            msg = self.text.render("FIN : Appuie sur R pour recommencer", True, WHITE)
             rect = msg.get_rect(centerx=WIDTH // 2, centery=HEIGHT // 2)
-            self.screen.blit(msg, rect)
-
-        pygame.display.flip()                           # met à jour l’écran
+            rects.append(self.screen.blit(msg, rect))
+        elif not self.focused:
+            msg = self.text.render("PAUSE", True, WHITE)
+            rect = msg.get_rect(centerx=WIDTH // 2, centery=HEIGHT // 2)
+            rects.append(self.screen.blit(msg, rect))
+        return rects
+
+    def draw_dirty(self, alpha=1.0):
+        """Rendu par zones modifiées : restaure le fond sous les sprites déplacés,
+        redessine, puis n’envoie que ces zones à l’écran."""
+        screen, background = self.screen, self.background
+        prof = self.profiler
+        with prof.section("background"):
+            self.all_sprites.clear(screen, background)  # fond sous les anciennes positions
+            for r in self._bullet_rects:
+                screen.blit(background, r, r)
+        with prof.section("sprite_draw"):
+            dirty = self.all_sprites.draw(screen)       # anciennes ∪ nouvelles positions
+            if self.vectorized_bullets:
+                dirty += self._bullet_rects
+                self._bullet_rects = self.enemy_bullets.draw(screen, True, alpha)
+                dirty += self._bullet_rects
+
+        # HUD : redessiné seulement si ses valeurs changent ou si un sprite l’a effacé
+        with prof.section("hud"):
+            hud_key = (self.score, self.player.lives, self.waves.number, self.state, self.focused)
+            old = self._hud_rects
+            if hud_key != self._hud_key or any(r.collidelist(old) != -1 for r in dirty):
+                for r in old:
+                    screen.blit(background, r, r)
+                for spr in self.all_sprites:            # sprites sous le HUD effacé
+                    if spr.rect.collidelist(old) != -1:
+                        screen.blit(spr.image, spr.rect)
+                self._hud_rects = self.draw_hud()
+                self._hud_key = hud_key
+                dirty += old
+                dirty += self._hud_rects
+
+        if not self.headless and dirty:
+            with prof.section("flip"):
+                pygame.display.update(dirty)            # seulement les zones modifiées
 
 
 # ---------------------------------------------------------------
 # Lancement du jeu
 # ---------------------------------------------------------------
 if __name__ == "__main__":
-    Game().run()
+    # python mainwithasset.py --headless [frames] : mesure la vitesse de simulation sans fenêtre
+    # python mainwithasset.py --record session.sirp : joue en enregistrant la session
+    # python mainwithasset.py --profile trace.csv : joue avec le profileur (F3), trace en sortie
+    # python mainwithasset.py --endless : vagues générées sans fin après layouts/*.wave
+    if "--headless" in sys.argv:
+        idx = sys.argv.index("--headless")
+        n_frames = int(sys.argv[idx + 1]) if len(sys.argv) > idx + 1 else 100_000
+        game = Game(headless=True)
+        fps = game.run_headless(n_frames)
+        print(f"{game.frame} frames simulées, {fps:.0f} frames/s (score {game.score})")
+    elif "--record" in sys.argv:
+        from replay import Recorder
+        seed = random.SystemRandom().randrange(2 ** 64)
+        Game(seed=seed, recorder=Recorder(sys.argv[sys.argv.index("--record") + 1], seed)).run()
+    elif "--profile" in sys.argv:
+        trace_path = sys.argv[sys.argv.index("--profile") + 1]
+        game = Game(profile="trace")
+        game.show_profiler = True
+        try:
+            game.run()
+        finally:                                  # run() se termine par sys.exit()
+            if trace_path.endswith(".json"):
+                game.profiler.export_json(trace_path)
+            else:
+                game.profiler.export_csv(trace_path)
+    else:
+        Game(endless="--endless" in sys.argv).run()
@@ -0,0 +1,141 @@
+# ---------------------------------------------------------------
+# Encodage numérique compact de l’état du jeu (observations des agents)
+# ---------------------------------------------------------------
+# L’état utile d’une partie est écrit à chaque pas dans UN tampon float32
+# préalloué, à disposition fixe :
+#
+#   [0]  x du joueur (centre, / WIDTH)      [4]  y de l’origine de la flotte (/ HEIGHT)
+#   [1]  vies                               [5]  direction de la flotte (+1 / -1)
+#   [2]  cooldown restant (fraction)        [6]  nombre de balles du joueur
+#   [3]  x de l’origine de la flotte (/ W)  [7]  nombre de balles ennemies
+#   [8]  numéro de la vague (1, 2, ...)
+#   [HEADER : +max_enemies]                 masque des ennemis vivants (1 par emplacement)
+#   [... : +2*max_enemies]                  emplacements de la vague (x, y par rapport à
+#                                           l’origine de la flotte, / W, H), 0 au-delà
+#   [... : +2*max_bullets]                  balles du joueur (x, y), 0 au-delà du nombre
+#   [... : +2*max_enemy_bullets]            balles ennemies (x, y), 0 au-delà du nombre
+#
+# Le numéro d’emplacement n’a de sens que dans sa vague : la position de l’ennemi k
+# à l’écran est l’origine de la flotte + emplacement k. max_enemies vaut par défaut la
+# plus grande vague de la séquence du jeu (WaveSequence.capacity) ; une vague plus
+# grande lève ValueError au lieu d’être tronquée.
+#
+# Les consommateurs lisent le tampon via un memoryview : aucune allocation par pas.
+# Un aperçu basse résolution de game.screen (raster) est disponible en option.
+import numpy as np
+import pygame
+
+from mainwithasset import HEIGHT, WIDTH
+
+HEADER = 9
+
+
+class ObservationEncoder:
+    """Écrit l’état d’une partie dans un tampon numpy préalloué à disposition fixe."""
+
+    def __init__(self, game, max_enemies=None, max_bullets=16, max_enemy_bullets=64, raster=None):
+        self.game = game
+        if max_enemies is None:
+            max_enemies = game.waves.capacity()
+        self.max_enemies = max_enemies
+        self.max_bullets = max_bullets
+        self.max_enemy_bullets = max_enemy_bullets
+        self.size = self.size_for(max_enemies, max_bullets, max_enemy_bullets)
+        self.array = np.zeros(self.size, dtype=np.float32)
+        self.view = memoryview(self.array)              # accès sans copie pour les consommateurs
+        self._alive = slice(HEADER, HEADER + max_enemies)
+        start = HEADER + max_enemies
+        self._slots = self.array[start:start + 2 * max_enemies].reshape(max_enemies, 2)
+        self._wave = None                               # vague dont les emplacements sont écrits
+        start += 2 * max_enemies
+        self._bullets = self.array[start:start + 2 * max_bullets].reshape(max_bullets, 2)
+        start += 2 * max_bullets
+        self._enemy_bullets = self.array[start:].reshape(max_enemy_bullets, 2)
+        # Aperçu basse résolution (w, h) de l’écran, en RGB uint8
+        self.raster_size = raster
+        if raster is not None:
+            self._small = pygame.Surface(raster)
+            self.raster_array = np.zeros((raster[0], raster[1], 3), dtype=np.uint8)
+            self.raster_view = memoryview(self.raster_array)
+
+    @staticmethod
+    def size_for(max_enemies, max_bullets=16, max_enemy_bullets=64):
+        """Taille du tampon (en float32) pour ces capacités."""
+        return HEADER + 3 * max_enemies + 2 * max_bullets + 2 * max_enemy_bullets
+
+    def encode(self):
+        """Met le tampon à jour d’après l’état courant ; renvoie le memoryview."""
+        game, a = self.game, self.array
+        player, fleet = game.player, game.fleet
+        a[0] = player.rect.centerx / WIDTH
+        a[1] = player.lives
+        cooldown = player.shoot_cooldown
+        a[2] = max(0, cooldown - (game.now() - player.last_shot)) / cooldown if cooldown else 0.0
+        a[3] = fleet.x / WIDTH
+        a[4] = fleet.y / HEIGHT
+        a[5] = game.fleet_dir
+        a[6] = len(game.bullets)
+        a[7] = len(game.enemy_bullets)
+        a[8] = game.waves.number
+        if game.wave is not self._wave:
+            self._write_slots(game.wave)
+
+        # Masque des ennemis vivants (tenu à jour par la flotte à chaque mort)
+        alive = np.frombuffer(fleet.alive, dtype=np.uint8)
+        a[self._alive] = 0
+        a[HEADER:HEADER + len(alive)] = alive
+
+        # Balles du joueur (peu nombreuses : parcours des sprites)
+        out = self._bullets
+        out[:] = 0
+        for k, b in enumerate(game.bullets):
+            if k == self.max_bullets:
+                break
+            out[k, 0] = b.rect.centerx / WIDTH
+            out[k, 1] = b.rect.centery / HEIGHT
+
+        # Balles ennemies : copie directe des tableaux du moteur vectorisé si actif
+        out = self._enemy_bullets
+        out[:] = 0
+        bullets = game.enemy_bullets
+        if game.vectorized_bullets:
+            n = min(len(bullets), self.max_enemy_bullets)
+            xs, ys = out[:n, 0], out[:n, 1]             # vues : écriture sans allocation
+            np.add(bullets.x[:n], bullets.w / 2, out=xs)
+            np.add(bullets.y[:n], bullets.h / 2, out=ys)
+            xs /= WIDTH
+            ys /= HEIGHT
+        else:
+            for k, b in enumerate(bullets):
+                if k == self.max_enemy_bullets:
+                    break
+                out[k, 0] = b.rect.centerx / WIDTH
+                out[k, 1] = b.rect.centery / HEIGHT
+        return self.view
+
+    def _write_slots(self, wave):
+        """Emplacements de la nouvelle vague (écrits une fois par vague)."""
+        slots = wave.slots
+        if len(slots) > self.max_enemies:
+            raise ValueError(f"vague {wave.name!r} de {len(slots)} ennemis : l’observation "
+                             f"n’a que {self.max_enemies} emplacements (max_enemies)")
+        out = self._slots
+        out[:] = 0
+        if slots:
+            out[:len(slots)] = slots
+            out[:len(slots)] /= (WIDTH, HEIGHT)
+        self._wave = wave
+
+    def raster(self, render=True):
+        """Aperçu basse résolution de l’écran (memoryview RGB (w, h, 3)).
+
+        render : dessine d’abord la frame courante (en headless, l’écran n’est
+                 sinon mis à jour que si le code appelant appelle game.draw()).
+        """
+        if self.raster_size is None:
+            raise ValueError("ObservationEncoder créé sans raster=(w, h)")
+        if render:
+            self.game.draw()
+        pygame.transform.scale(self.game.screen, self.raster_size, self._small)
+        pygame.pixelcopy.surface_to_array(self.raster_array, self._small)
+        return self.raster_view
@@ -0,0 +1,59 @@
+# ---------------------------------------------------------------
+# Pools d’objets pour les sprites à durée de vie courte (balles)
+# ---------------------------------------------------------------
+# Créer puis détruire un Sprite à chaque tir (et une Surface par balle ennemie)
+# génère beaucoup d’allocations et réveille le ramasse-miettes en pleine partie.
+# Un SpritePool garde les sprites libérés et les réutilise :
+#   sprite = pool.acquire(x, y, ...)   -> sprite libre réinitialisé par sprite.spawn(...)
+#   sprite.kill()                      -> retiré des groupes puis rendu au pool
+# Les sprites poolés héritent de PooledSprite et définissent spawn(*args).
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite qui retourne dans son pool quand il est tué (kill())."""
+
+    pool = None                           # SpritePool d’origine (None = sprite hors pool)
+
+    def kill(self):
+        was_alive = self.alive()          # un double kill() ne libère qu’une fois
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+
+class SpritePool:
+    """Réserve de sprites réutilisables avec acquisition / libération."""
+
+    def __init__(self, factory, size=0):
+        self.factory = factory            # crée un sprite neuf quand la réserve est vide
+        self.free = []                    # sprites disponibles (pile)
+        self.in_use = 0                   # sprites actuellement en jeu
+        self.high_water = 0               # maximum de sprites en jeu simultanément
+        self.created = 0                  # sprites réellement alloués
+        for _ in range(size):             # préallocation
+            self.free.append(self._new())
+
+    def _new(self):
+        sprite = self.factory()
+        sprite.pool = self
+        self.created += 1
+        return sprite
+
+    def acquire(self, *args, **kwargs):
+        """Sprite prêt à l’emploi, initialisé avec spawn(*args, **kwargs)."""
+        sprite = self.free.pop() if self.free else self._new()
+        sprite.spawn(*args, **kwargs)
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return sprite
+
+    def release(self, sprite):
+        """Rend un sprite au pool (appelé par sprite.kill())."""
+        self.in_use -= 1
+        self.free.append(sprite)
+
+    def stats(self):
+        return {"in_use": self.in_use, "free": len(self.free), "high_water": self.high_water,
+                "created": self.created}
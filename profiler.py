@@ -0,0 +1,153 @@
+# ---------------------------------------------------------------
+# Profileur de frames : temps par phase, percentiles, overlay et traces
+# ---------------------------------------------------------------
+# Chaque phase de la boucle (événements, mise à jour, dessin) et ses sous-phases
+# (déplacement de flotte, collisions, tir ennemi, fond, sprites, HUD, flip...)
+# est chronométrée avec perf_counter_ns :
+#
+#   with game.profiler.section("fleet"):
+#       ...
+#   game.profiler.end_frame()        # clôt la frame : fenêtre glissante + trace
+#
+# Les percentiles (p50/p95/p99) portent sur les `window` dernières frames.
+# Les traces par frame s’exportent en CSV ou JSON pour comparer deux versions.
+# Sans profilage, Game utilise NullProfiler : les sections ne coûtent presque rien.
+import csv
+import json
+from collections import deque
+from time import perf_counter_ns
+
+import pygame
+
+
+class _Section:
+    """Chronomètre réutilisable d’une phase (context manager sans allocation)."""
+
+    __slots__ = ("times", "name", "start")
+
+    def __init__(self, times, name):
+        self.times = times
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        times = self.times
+        times[self.name] = times.get(self.name, 0) + perf_counter_ns() - self.start
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    """Profileur inactif : même interface, aucun chronométrage."""
+
+    enabled = False
+    _section = _NullSection()
+
+    def section(self, name):
+        return self._section
+
+    def end_frame(self):
+        pass
+
+
+class FrameProfiler:
+    """Temps par phase (ns) avec fenêtre glissante de percentiles et trace optionnelle."""
+
+    enabled = True
+
+    def __init__(self, window=600, trace=False):
+        self.window = window                    # nombre de frames pour les percentiles
+        self.current = {}                       # phase -> ns cumulées dans la frame en cours
+        self.samples = {}                       # phase -> deque des dernières frames (ns)
+        self.trace = [] if trace else None      # une ligne {phase: ms} par frame
+        self.frames = 0
+        self._sections = {}
+        self._overlay = None                    # lignes de texte déjà rendues
+        self._font = None
+
+    def section(self, name):
+        """Context manager qui ajoute sa durée à la phase `name` de la frame en cours."""
+        sec = self._sections.get(name)
+        if sec is None:
+            sec = self._sections[name] = _Section(self.current, name)
+        return sec
+
+    def end_frame(self):
+        """Clôt la frame : range les durées dans les fenêtres et dans la trace."""
+        current = self.current
+        for name, ns in current.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ns)
+        if self.trace is not None:
+            row = {"frame": self.frames}
+            row.update((name, ns / 1e6) for name, ns in current.items())
+            self.trace.append(row)
+        self.frames += 1
+        current.clear()
+
+    # --- Statistiques ---
+    def percentiles(self, name, qs=(50, 95, 99)):
+        """Percentiles (ms) de la phase sur la fenêtre glissante."""
+        samples = sorted(self.samples.get(name, ()))
+        if not samples:
+            return tuple(0.0 for _ in qs)
+        last = len(samples) - 1
+        return tuple(samples[min(last, round(q / 100 * last))] / 1e6 for q in qs)
+
+    def report(self):
+        """{phase: {"p50": ms, "p95": ms, "p99": ms, "mean": ms}} sur la fenêtre."""
+        out = {}
+        for name, samples in self.samples.items():
+            p50, p95, p99 = self.percentiles(name)
+            out[name] = {"p50": p50, "p95": p95, "p99": p99,
+                         "mean": sum(samples) / len(samples) / 1e6}
+        return out
+
+    # --- Export des traces ---
+    def export_csv(self, path):
+        """Écrit la trace (une ligne par frame, une colonne par phase, en ms)."""
+        rows = self.trace or []
+        names = sorted({name for row in rows for name in row if name != "frame"})
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["frame", *names], restval=0.0)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def export_json(self, path):
+        """Écrit la trace et les percentiles au format JSON."""
+        with open(path, "w") as f:
+            json.dump({"frames": self.trace or [], "summary": self.report()}, f, indent=1)
+
+    # --- Overlay à l’écran ---
+    def draw_overlay(self, surface, pos=(10, 50), refresh=30):
+        """Affiche p50/p95/p99 par phase ; le texte n’est recalculé que toutes les
+        `refresh` frames (le rendu de texte coûterait plus cher que ce qu’on mesure)."""
+        if self._font is None:
+            self._font = pygame.font.SysFont("monospace", 14)
+        if self._overlay is None or self.frames % refresh == 0:
+            lines = [f"{'phase':<12}{'p50':>7}{'p95':>7}{'p99':>7} ms"]
+            for name in sorted(self.samples):
+                p50, p95, p99 = self.percentiles(name)
+                lines.append(f"{name:<12}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+            self._overlay = [self._font.render(line, True, (255, 255, 0), (0, 0, 0))
+                             for line in lines]
+        x, y = pos
+        rects = []
+        for surf in self._overlay:
+            rects.append(surface.blit(surf, (x, y)))
+            y += surf.get_height()
+        return rects
@@ -0,0 +1,127 @@
+# ---------------------------------------------------------------
+# Enregistrement / relecture déterministe d’une session de jeu
+# ---------------------------------------------------------------
+# Une session est entièrement déterminée par la graine du hasard du jeu (Game.rng),
+# les réglages de la simulation (Game.sim_options : fréquence, dispositions des
+# vagues, vagues infinies, apparition des ennemis, collisions, équilibrage) et le
+# masque d’actions ACTION_* de chaque frame (l’horloge du jeu est dérivée du nombre
+# de frames). Le journal est donc minuscule :
+#
+#   en-tête : b"SIRP" | version (1 octet) | graine (8 octets, little-endian)
+#             | longueur (4 octets) + réglages en JSON
+#   corps   : 1 octet par frame = masque d’actions (ajouté au fil de la partie)
+#
+# La version change dès que la simulation elle-même change (mêmes entrées, autre
+# partie) : un ancien journal est refusé au lieu d’être rejoué comme une autre partie.
+#
+# La relecture rejoue ces entrées dans Game.step() en headless, sans limite de FPS :
+# une heure de jeu (216 000 frames) se rejoue en quelques secondes.
+#
+# Lancer : python replay.py session.sirp [--render]
+import json
+import struct
+import sys
+import time
+
+HEADER = struct.Struct("<4sBQI")
+MAGIC = b"SIRP"
+VERSION = 4                # 2 : vagues enchaînées, ligne de front, réglages ;
+                           # 3 : ligne de front des rangées décalées (vagues infinies) ;
+                           # 4 : dispositions des vagues et apparition des ennemis
+
+
+class Recorder:
+    """Journal binaire en ajout seul : graine, réglages, puis un octet d’actions par frame.
+
+    options : réglages de Game (Game.sim_options) ; un Game qui reçoit ce Recorder les
+              fournit lui-même. L’en-tête est écrit à la première frame.
+    """
+
+    def __init__(self, path, seed, options=None):
+        self.path = path
+        self.seed = seed
+        self.options = options
+        self.frames = 0
+        self._file = open(path, "wb")
+        self._started = False
+
+    def _write_header(self):
+        options = json.dumps(self.options or {}, sort_keys=True).encode("utf-8")
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.seed, len(options)) + options)
+        self._started = True
+
+    def record(self, actions):
+        """Ajoute les actions d’une frame au journal."""
+        if not self._started:
+            self._write_header()
+        self._file.write(bytes((actions,)))
+        self.frames += 1
+
+    def close(self):
+        if not self._file.closed:
+            if not self._started:
+                self._write_header()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_log(path):
+    """Lit un journal ; renvoie (graine, réglages de Game, bytes des actions par frame)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path} : journal trop court")
+    magic, version, seed, size = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} : ce n’est pas un journal de session")
+    if version != VERSION:
+        raise ValueError(f"{path} : version {version} non supportée (attendu {VERSION})")
+    end = HEADER.size + size
+    options = json.loads(raw[HEADER.size:end].decode("utf-8"))
+    return seed, options, raw[end:]
+
+
+def replay(path, render=False, game_kwargs=None):
+    """Rejoue une session en headless, aussi vite que possible.
+
+    Le jeu est recréé avec les réglages enregistrés (vagues comprises) ; game_kwargs ajoute
+    des options sans effet sur la partie (vectorized_bullets, profile...) et ne peut pas
+    les contredire.
+    Renvoie (game, frames simulées par seconde) ; game est dans l’état final de la session.
+    """
+    from mainwithasset import Game
+    from waves import Wave
+
+    seed, options, frames = read_log(path)
+    kwargs = dict(options)
+    if "waves" in options:                        # dispositions enregistrées -> Wave
+        kwargs["waves"] = [Wave(**w) for w in options["waves"]]
+    for key, value in (game_kwargs or {}).items():
+        if key == "waves" and "waves" in options:
+            raise ValueError(f"{path} : les vagues sont celles de l’enregistrement")
+        if key in options and options[key] != value:
+            raise ValueError(f"{path} : {key}={value!r} contredit l’enregistrement ({options[key]!r})")
+        kwargs[key] = value
+    game = Game(headless=True, seed=seed, **kwargs)
+    step, draw = game.step, game.draw
+    start = time.perf_counter()
+    for actions in frames:
+        step(actions)
+        if render:
+            draw()
+    elapsed = time.perf_counter() - start
+    return game, (len(frames) / elapsed if elapsed > 0 else float("inf"))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("usage : python replay.py session.sirp [--render]")
+        sys.exit(1)
+    game, fps = replay(sys.argv[1], render="--render" in sys.argv)
+    print(f"{game.frame} frames rejouées à {fps:.0f} frames/s : score {game.score}, "
+          f"vies {game.player.lives}")
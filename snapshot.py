@@ -0,0 +1,208 @@
+# ---------------------------------------------------------------
+# Instantané / restauration de l’état complet d’une partie (retour arrière rapide)
+# ---------------------------------------------------------------
+# save(game) range tout l’état de la simulation dans un bloc d’octets compact ;
+# restore(game, blob) remet la même partie exactement dans cet état (la suite est
+# identique, frame pour frame, à celle de la partie d’origine). Rien n’est rechargé :
+# images, pools et groupes de sprites sont réutilisés.
+#
+#   en-tête   : b"SISN" | version | balles vectorisées (0/1)
+#   partie    : frame, score, état, flotte (origine, direction, vitesse, descente),
+#               vague (numéro, index dans la séquence, emplacements déjà peuplés)
+#   joueur    : position, vies, dernier tir, cooldown, vitesse, actions du pas
+#   hasard    : état de Game.rng (624 mots de Mersenne Twister + index + gauss)
+#   flotte    : 1 octet par emplacement (vivant / détruit), puis les emplacements de
+#               la ligne de front dans leur ordre (il fixe le tireur tiré au hasard)
+#   [vague générée : réglages + emplacements]
+#   balles    : balles du joueur, puis balles ennemies (sprites ou tableaux NumPy)
+#
+# Les ennemis ne stockent que leur emplacement dans la formation : restaurer la
+# flotte revient à recréer les ennemis vivants aux emplacements de la vague.
+import struct
+
+from waves import Wave
+
+MAGIC = b"SISN"
+VERSION = 4
+HEAD = struct.Struct("<4sBB")
+GAME = struct.Struct("<qqBbddddddIiII")
+PLAYER = struct.Struct("<diiiiiqddB")
+RNG = struct.Struct("<625IBd")
+WAVE = struct.Struct("<ddddI")
+SLOT = struct.Struct("<hh")
+COUNT = struct.Struct("<I")
+SHOOTER = struct.Struct("<I")
+BULLET = struct.Struct("<iiiidd")             # x, y, prev_x, prev_y, pos_y, speed
+ENEMY_BULLET = struct.Struct("<iiiiddqddddd")  # rect, prev, spawn_x/y, k, speed, amp, freq, phase, drift
+
+
+def _number(value):
+    """Valeur relue en flottant, rendue entière si elle l’était (mêmes calculs ensuite)."""
+    return int(value) if value.is_integer() else value
+
+
+def save(game):
+    """État complet de la partie sous forme de bytes."""
+    parts = [HEAD.pack(MAGIC, VERSION, game.vectorized_bullets)]
+    fleet, player, waves = game.fleet, game.player, game.waves
+    try:
+        wave_index = waves.waves.index(game.wave)
+    except ValueError:                          # vague générée (mode infini)
+        wave_index = -1
+    parts.append(GAME.pack(game.frame, game.score, game.state, game.fleet_dir,
+                           game.fleet_speed, game.drop_amount, fleet.x, fleet.y,
+                           game.fleet_prev[0], game.fleet_prev[1],
+                           waves.number, wave_index, game._spawn_next, len(fleet.alive)))
+    rect = player.rect
+    parts.append(PLAYER.pack(player.pos_x, rect.x, rect.y, player.prev[0], player.prev[1],
+                             player.lives, player.last_shot, player.shoot_cooldown,
+                             player.speed, player.actions))
+    version, internal, gauss = game.rng.getstate()
+    parts.append(RNG.pack(*internal, gauss is not None, gauss or 0.0))
+    parts.append(bytes(fleet.alive))
+    front = fleet.front_order
+    parts.append(COUNT.pack(len(front)))
+    parts.extend(SHOOTER.pack(slot) for slot in front)
+    if wave_index < 0:
+        wave = game.wave
+        parts.append(WAVE.pack(wave.speed, wave.drop, wave.fire, wave.fire_min, len(wave.slots)))
+        parts.extend(SLOT.pack(x, y) for x, y in wave.slots)
+
+    bullets = game.bullets.sprites()
+    parts.append(COUNT.pack(len(bullets)))
+    for b in bullets:
+        parts.append(BULLET.pack(b.rect.x, b.rect.y, b.prev[0], b.prev[1], b.pos_y, b.speed))
+
+    engine = game.enemy_bullets
+    if game.vectorized_bullets:
+        n = engine.count
+        parts.append(COUNT.pack(n))
+        parts.extend(getattr(engine, name)[:n].tobytes() for name in engine.FIELDS)
+    else:
+        enemy_bullets = engine.sprites()
+        parts.append(COUNT.pack(len(enemy_bullets)))
+        for b in enemy_bullets:
+            parts.append(ENEMY_BULLET.pack(b.rect.x, b.rect.y, b.prev[0], b.prev[1],
+                                           b.spawn_x, b.spawn_y, b.k, b.speed, b.amp, b.freq,
+                                           b.phase, b.drift))
+    return b"".join(parts)
+
+
+def restore(game, blob):
+    """Remet game dans l’état enregistré par save() (même jeu, mêmes options)."""
+    from mainwithasset import Enemy
+
+    magic, version, vectorized = HEAD.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("instantané invalide ou de version non supportée")
+    if bool(vectorized) != game.vectorized_bullets:
+        raise ValueError("instantané pris avec un autre moteur de balles ennemies")
+    offset = HEAD.size
+    (frame, score, state, fleet_dir, fleet_speed, drop, fleet_x, fleet_y, prev_x, prev_y,
+     wave_number, wave_index, spawn_next, n_slots) = GAME.unpack_from(blob, offset)
+    offset += GAME.size
+    (pos_x, px, py, ppx, ppy, lives, last_shot, cooldown, speed,
+     actions) = PLAYER.unpack_from(blob, offset)
+    offset += PLAYER.size
+    *internal, has_gauss, gauss = RNG.unpack_from(blob, offset)
+    offset += RNG.size
+    alive = blob[offset:offset + n_slots]
+    offset += n_slots
+    count, = COUNT.unpack_from(blob, offset)
+    offset += COUNT.size
+    front = [slot for slot, in SHOOTER.iter_unpack(blob[offset:offset + count * SHOOTER.size])]
+    offset += count * SHOOTER.size
+    if wave_index >= 0:
+        wave = game.waves.waves[wave_index]
+    else:
+        w_speed, w_drop, fire, fire_min, n = WAVE.unpack_from(blob, offset)
+        offset += WAVE.size
+        slots = list(SLOT.iter_unpack(blob[offset:offset + n * SLOT.size]))
+        offset += n * SLOT.size
+        wave = Wave(slots, w_speed, int(w_drop), fire, fire_min, name=f"infinie {wave_number}")
+
+    # --- Vider la partie en cours (les balles retournent dans leurs pools) ---
+    for b in game.bullets.sprites():
+        b.kill()
+    if not game.vectorized_bullets:
+        for b in game.enemy_bullets.sprites():
+            b.kill()
+    game.enemies.empty()
+    all_sprites = game.all_sprites
+    all_sprites.empty()
+
+    # --- Partie, vague et joueur ---
+    game.frame, game.score, game.state = frame, score, state
+    game.waves.number = wave_number
+    game.wave = wave
+    game._spawn_next = spawn_next
+    game.fleet_dir, game.fleet_speed = fleet_dir, _number(fleet_speed)
+    game.drop_amount = _number(drop)
+    game.fleet_prev = (_number(prev_x), _number(prev_y))
+    game.rng.setstate((3, tuple(internal), gauss if has_gauss else None))
+    player = game.player
+    player.pos_x = pos_x
+    player.rect.topleft = (px, py)
+    player.prev = (ppx, ppy)
+    player.lives, player.last_shot = lives, last_shot
+    player.shoot_cooldown, player.speed, player.actions = _number(cooldown), speed, actions
+    all_sprites.add(player)
+
+    # --- Flotte : ennemis vivants recréés à leur emplacement ---
+    fleet = game.fleet = type(game.fleet)(_number(fleet_x), _number(fleet_y))
+    ox, oy = int(fleet_x), int(fleet_y)
+    img, enemies = game.enemy_img, game.enemies
+    for (x, y), flag in zip(wave.slots, alive):
+        if flag:
+            e = Enemy(ox + x, oy + y, img)
+            enemies.add(e)
+            all_sprites.add(e)
+            fleet.add(e)
+        else:
+            fleet.skip()
+    fleet.front_order = front
+
+    # --- Balles ---
+    count, = COUNT.unpack_from(blob, offset)
+    offset += COUNT.size
+    pool, img = game.bullet_pool, game.player_bullet_img
+    end = offset + count * BULLET.size
+    for x, y, bx, by, pos_y, b_speed in BULLET.iter_unpack(blob[offset:end]):
+        b = pool.acquire(0, 0, img, b_speed)
+        b.rect.topleft = (x, y)
+        b.pos_y, b.prev = pos_y, (bx, by)
+        game.bullets.add(b)
+        all_sprites.add(b)
+    offset = end
+
+    count, = COUNT.unpack_from(blob, offset)
+    offset += COUNT.size
+    engine = game.enemy_bullets
+    if game.vectorized_bullets:
+        import numpy as np
+
+        engine.clear()
+        if count > engine.capacity:
+            engine._alloc(count)
+        for name in engine.FIELDS:
+            arr = getattr(engine, name)
+            size = count * arr.itemsize
+            arr[:count] = np.frombuffer(blob, dtype=arr.dtype, count=count, offset=offset)
+            offset += size
+        engine.count = count
+    else:
+        pool = game.enemy_bullet_pool
+        end = offset + count * ENEMY_BULLET.size
+        for (x, y, bx, by, spawn_x, spawn_y, k, b_speed, amp, freq, phase,
+             drift) in ENEMY_BULLET.iter_unpack(blob[offset:end]):
+            b = pool.acquire(spawn_x, spawn_y, b_speed, amp, freq, phase, drift)
+            b.rect.topleft = (x, y)
+            b.prev, b.k = (bx, by), k
+            engine.add(b)
+            all_sprites.add(b)
+        offset = end
+
+    # --- Rendu : tout redessiner à la prochaine frame ---
+    game._full_redraw = True
+    game._bullet_rects = []
+    game._hud_key = None
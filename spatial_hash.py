@@ -0,0 +1,163 @@
+# ---------------------------------------------------------------
+# Grille de hachage spatial (broadphase des collisions)
+# ---------------------------------------------------------------
+# pygame.sprite.groupcollide(A, B) teste toutes les paires (len(A) × len(B) tests).
+# Ici l’écran est découpé en cellules carrées : chaque sprite de A est rangé dans
+# les cellules que couvre son rect, et chaque sprite de B n’est testé que contre
+# les sprites de A partageant ses cellules.
+#
+# La grille est mise à jour de façon incrémentale : un sprite n’est déplacé d’une
+# cellule à l’autre que si les cellules couvertes par son rect ont changé.
+#
+# rect_attr permet d’indexer un autre rect que sprite.rect : la flotte indexe les
+# rects locaux de ses ennemis (fixes par rapport à l’origine de la formation) et
+# décale les balles de -origine au moment du test (paramètre offset).
+from collections import defaultdict
+from operator import attrgetter
+
+
+class SpatialHash:
+    """Index spatial uniforme de sprites (clé = cellule de cell_size × cell_size px)."""
+
+    def __init__(self, cell_size=64, rect_attr="rect"):
+        self.cell_size = cell_size
+        self.rect_attr = rect_attr
+        self._rect_of = attrgetter(rect_attr)
+        self.cells = defaultdict(dict)     # (cx, cy) -> {sprite: None} (ensemble ordonné)
+        self.bounds = {}                   # sprite -> (cx0, cy0, cx1, cy1) cellules couvertes
+        self.order = {}                    # sprite -> rang d’insertion (ordre du Group)
+        self._next = 0
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, sprite):
+        return sprite in self.bounds
+
+    def _bounds(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs)
+
+    def _link(self, sprite, b):
+        cells = self.cells
+        for cx in range(b[0], b[2] + 1):
+            for cy in range(b[1], b[3] + 1):
+                cells[(cx, cy)][sprite] = None
+        self.bounds[sprite] = b
+
+    def _unlink(self, sprite, b):
+        cells = self.cells
+        for cx in range(b[0], b[2] + 1):
+            for cy in range(b[1], b[3] + 1):
+                cell = cells[(cx, cy)]
+                del cell[sprite]
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def insert(self, sprite):
+        """Ajoute un sprite (ou le met à jour s’il est déjà indexé)."""
+        if sprite in self.bounds:
+            self.move(sprite)
+            return
+        self.order[sprite] = self._next
+        self._next += 1
+        self._link(sprite, self._bounds(self._rect_of(sprite)))
+
+    def remove(self, sprite):
+        """Retire un sprite de la grille (sans erreur s’il n’y est pas)."""
+        b = self.bounds.pop(sprite, None)
+        if b is not None:
+            self._unlink(sprite, b)
+            del self.order[sprite]
+
+    def move(self, sprite):
+        """Recalcule les cellules d’un sprite ; ne touche la grille que si elles ont changé."""
+        b = self._bounds(self._rect_of(sprite))
+        old = self.bounds[sprite]
+        if b != old:
+            self._unlink(sprite, old)
+            self._link(sprite, b)
+
+    def sync(self, sprites):
+        """Met la grille à jour d’après un Group : ajouts, déplacements et suppressions."""
+        bounds = self.bounds
+        cs = self.cell_size
+        rect_of = self._rect_of
+        for s in sprites:
+            old = bounds.get(s)
+            if old is None:
+                self.insert(s)
+                continue
+            r = rect_of(s)
+            b = (r.left // cs, r.top // cs, (r.right - 1) // cs, (r.bottom - 1) // cs)
+            if b != old:                                    # calcul en ligne (boucle chaude)
+                self._unlink(s, old)
+                self._link(s, b)
+        if len(bounds) != len(sprites):                     # sprites disparus du Group
+            for s in [s for s in bounds if s not in sprites]:
+                self.remove(s)
+
+    def query(self, rect):
+        """Sprites candidats (cellules communes avec rect), sans test de rect."""
+        b = self._bounds(rect)
+        cells = self.cells
+        if b[0] == b[2] and b[1] == b[3]:                  # cas courant : une seule cellule
+            return list(cells.get((b[0], b[1]), ()))
+        found = {}
+        for cx in range(b[0], b[2] + 1):
+            for cy in range(b[1], b[3] + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found)
+
+    def spritecollide(self, sprite, dokill=False, offset=(0, 0), collided=None):
+        """Équivalent de pygame.sprite.spritecollide(sprite, group_indexé, dokill).
+
+        offset : origine du repère des rects indexés (rect de sprite décalé de -offset).
+        collided : test fin collided(sprite, s), appliqué seulement si les rects se chevauchent.
+        """
+        rect = sprite.rect.move(-offset[0], -offset[1])
+        rect_of = self._rect_of
+        hits = [s for s in self.query(rect) if rect.colliderect(rect_of(s))
+                and (collided is None or collided(sprite, s))]
+        hits.sort(key=self.order.__getitem__)
+        if dokill:
+            for s in hits:
+                self.remove(s)
+                s.kill()
+        return hits
+
+    def groupcollide(self, group, dokill_indexed, dokill_other, offset=(0, 0), collided=None):
+        """Équivalent de pygame.sprite.groupcollide(groupe_indexé, group, ...).
+
+        Renvoie le même dict {sprite indexé: [sprites de group touchés]} que pygame :
+        avec dokill_other, une balle touchant plusieurs ennemis n’est attribuée qu’au
+        premier dans l’ordre du groupe indexé, comme dans groupcollide.
+        offset : origine du repère des rects indexés (rects de group décalés de -offset).
+        collided : test fin collided(s, other), appliqué seulement si les rects se chevauchent.
+        """
+        order = self.order
+        rect_of = self._rect_of
+        ox, oy = offset
+        hits = {}
+        for other in group.sprites():
+            rect = other.rect
+            if ox or oy:
+                rect = rect.move(-ox, -oy)
+            touched = [s for s in self.query(rect) if rect.colliderect(rect_of(s))
+                       and (collided is None or collided(s, other))]
+            if not touched:
+                continue
+            if dokill_other:
+                touched = [min(touched, key=order.__getitem__)]
+                other.kill()
+            for s in touched:
+                hits.setdefault(s, []).append(other)
+        if len(hits) > 1:
+            hits = dict(sorted(hits.items(), key=lambda kv: order[kv[0]]))
+        if dokill_indexed:
+            for s in hits:
+                self.remove(s)
+                s.kill()
+        return hits
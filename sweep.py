@@ -0,0 +1,228 @@
+# ---------------------------------------------------------------
+# Balayages Monte Carlo des réglages d’équilibrage (parties headless en parallèle)
+# ---------------------------------------------------------------
+# Lancer :
+#   python sweep.py shoot_cooldown=150,250,400 fire=0.5,1,2 --games 500 --out equilibrage.csv
+#   options : --policy esquive|va_et_vient, --workers N, --max-seconds S,
+#             --sim-hz H, --seed S, --endless, --vectorized, --resume
+#
+# Chaque paramètre de mainwithasset.BALANCE peut recevoir une liste de valeurs ; le
+# produit cartésien forme la grille. Pour chaque point de la grille, `--games` parties
+# headless (graines seed, seed + 1, ...) sont jouées par un bot, réparties sur tous les
+# cœurs (multiprocessing.Pool). Les mêmes graines servent à tous les points : les écarts
+# entre deux réglages ne viennent pas du tirage des parties.
+#
+# Le tableau de résultats (CSV, une ligne par point : survie, score, taux de victoire)
+# est écrit au fur et à mesure, dès qu’un point est terminé : un balayage interrompu
+# garde ses lignes, et --resume ne rejoue que les points absents du fichier.
+#
+# Astuce : --sim-hz 20 divise par 3 le nombre de pas par partie ; les collisions
+# continues (swept, masques testés le long du trajet) ne laissent pas les balles
+# traverser leur cible malgré le grand pas. Les trajectoires restent échantillonnées
+# tous les 3 frames : les résultats sont proches de ceux à 60 Hz, pas identiques.
+import csv
+import itertools
+import multiprocessing as mp
+import os
+import statistics
+import sys
+import time
+
+from bench import sweep as back_and_forth
+from mainwithasset import (ACTION_FIRE, ACTION_LEFT, ACTION_RIGHT, BALANCE, FPS, GAME_OVER,
+                           WIDTH, Game)
+
+GAMES = 100                 # parties par point de la grille
+MAX_SECONDS = 600           # durée maximale d’une partie (temps de jeu simulé)
+SEED = 0
+CHUNK = 8                   # parties envoyées à la fois à un processus
+
+FIELDS = ("games", "win_rate", "survival_mean", "survival_p50", "survival_p10",
+          "score_mean", "score_std", "timeouts")
+
+
+# --- Joueurs automatiques ---
+def _enemy_bullets(game):
+    """Positions (centre x, bas) des balles ennemies, quel que soit le moteur."""
+    engine = game.enemy_bullets
+    if game.vectorized_bullets:
+        n = engine.count
+        return zip((engine.x[:n] + engine.w // 2).tolist(), (engine.y[:n] + engine.h).tolist())
+    return ((b.rect.centerx, b.rect.bottom) for b in engine)
+
+
+def dodge(game):
+    """Bot simple : fuit la balle ennemie la plus proche au-dessus de lui, sinon se place
+    sous la colonne d’ennemis la plus proche ; tire en continu."""
+    rect = game.player.rect
+    threat, threat_dy = None, 160                 # seules les balles proches comptent
+    for x, bottom in _enemy_bullets(game):
+        dy = rect.top - bottom
+        if 0 <= dy < threat_dy and abs(x - rect.centerx) < rect.width:
+            threat, threat_dy = x, dy
+    if threat is not None:
+        away = ACTION_LEFT if threat > rect.centerx else ACTION_RIGHT
+        if (away == ACTION_LEFT and rect.left <= 0) or (away == ACTION_RIGHT and rect.right >= WIDTH):
+            away ^= ACTION_LEFT | ACTION_RIGHT    # acculé au bord : passer de l’autre côté
+        return away | ACTION_FIRE
+    target = min((e.rect.centerx for e in game.enemies), default=rect.centerx,
+                 key=lambda x: abs(x - rect.centerx))
+    if target < rect.centerx - 4:
+        return ACTION_LEFT | ACTION_FIRE
+    if target > rect.centerx + 4:
+        return ACTION_RIGHT | ACTION_FIRE
+    return ACTION_FIRE
+
+
+POLICIES = {"esquive": dodge, "va_et_vient": back_and_forth}
+
+
+# --- Une partie ---
+_game = None                # partie réutilisée par le processus (images et pools déjà prêts)
+_options = None
+
+
+def _init_worker(options):
+    global _options
+    _options = options
+    # sans quoi SDL intercepte SIGTERM et Pool.terminate() (Ctrl+C) attend indéfiniment
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+
+
+def play(tuning, seed, policy, max_frames, game_kwargs):
+    """Joue une partie ; renvoie (secondes survécues, score, gagnée ?, arrêtée au temps max ?)."""
+    global _game
+    game = _game
+    if game is None:
+        game = _game = Game(headless=True, seed=seed, tuning=tuning, **game_kwargs)
+    game.tuning = dict(BALANCE, **tuning)
+    game.seed = seed
+    game.rng.seed(seed)
+    game.frame = 0
+    game.reset()
+    step = game.step
+    while game.frame < max_frames:
+        if step(policy(game)) == GAME_OVER:
+            break
+    seconds = game.frame / game.sim_hz
+    won = game.state == GAME_OVER and game.player.lives > 0 and not game.enemies \
+        and not game.spawning
+    return seconds, game.score, won, game.state != GAME_OVER
+
+
+def _run(task):
+    """Tâche d’un processus : plusieurs parties d’un même point."""
+    point, tuning, seeds = task
+    policy_name, max_frames, game_kwargs = _options
+    policy = POLICIES[policy_name]
+    return point, [play(tuning, seed, policy, max_frames, game_kwargs) for seed in seeds]
+
+
+# --- Agrégation ---
+def summarize(results):
+    """Ligne du tableau pour un point : statistiques sur ses parties."""
+    survival = sorted(r[0] for r in results)
+    scores = [r[1] for r in results]
+    n = len(results)
+    return {"games": n,
+            "win_rate": round(sum(r[2] for r in results) / n, 4),
+            "survival_mean": round(statistics.fmean(survival), 2),
+            "survival_p50": round(survival[n // 2], 2),
+            "survival_p10": round(survival[n // 10], 2),
+            "score_mean": round(statistics.fmean(scores), 2),
+            "score_std": round(statistics.pstdev(scores), 2),
+            "timeouts": sum(r[3] for r in results)}
+
+
+def parse_grid(specs):
+    """["nom=v1,v2", ...] -> (noms, liste des combinaisons de valeurs)."""
+    names, values = [], []
+    for spec in specs:
+        name, sep, raw = spec.partition("=")
+        if not sep or name not in BALANCE:
+            raise SystemExit(f"paramètre invalide : {spec!r} (connus : {', '.join(BALANCE)})")
+        names.append(name)
+        values.append([float(v) for v in raw.split(",")])
+    return names, list(itertools.product(*values))
+
+
+def _key(row, names):
+    return tuple(float(row[name]) for name in names)
+
+
+def sweep_grid(names, points, out, games=GAMES, policy="esquive", max_seconds=MAX_SECONDS,
+               sim_hz=FPS, seed=SEED, workers=None, resume=False, game_kwargs=None):
+    """Joue la grille et écrit une ligne par point dans `out` dès qu’il est terminé."""
+    game_kwargs = dict(game_kwargs or {}, sim_hz=sim_hz)
+    done = set()
+    if resume and os.path.exists(out):
+        with open(out, newline="") as f:
+            done = {_key(row, names) for row in csv.DictReader(f)}
+    todo = [p for p in points if p not in done]
+    seeds = list(range(seed, seed + games))
+    tasks = [(p, dict(zip(names, p)), seeds[i:i + CHUNK])
+             for p in todo for i in range(0, games, CHUNK)]
+    options = (policy, int(max_seconds * sim_hz), game_kwargs)
+
+    append = resume and os.path.exists(out)
+    print(f"{len(todo)} point(s) x {games} parties ({len(points) - len(todo)} déjà faits), "
+          f"{workers or os.cpu_count()} processus")
+    start = time.perf_counter()
+    pending = {p: [] for p in todo}
+    with open(out, "a" if append else "w", newline="") as f, \
+            mp.Pool(workers, initializer=_init_worker, initargs=(options,)) as pool:
+        writer = csv.writer(f)
+        if not append:
+            writer.writerow([*names, *FIELDS])
+        for point, results in pool.imap_unordered(_run, tasks):
+            pending[point].extend(results)
+            if len(pending[point]) < games:
+                continue
+            row = summarize(pending.pop(point))
+            writer.writerow([*point, *(row[k] for k in FIELDS)])
+            f.flush()                            # la ligne est sur disque même si on interrompt
+            elapsed = time.perf_counter() - start
+            print(f"  {dict(zip(names, point))} : victoires {row['win_rate']:.0%}, "
+                  f"survie {row['survival_mean']:.1f} s, score {row['score_mean']:.0f}"
+                  f"   [{len(todo) - len(pending)}/{len(todo)}, {elapsed:.0f} s]", flush=True)
+        pool.close()
+        pool.join()
+
+
+def main(argv):
+    args = list(argv)
+
+    def option(flag, default, cast=str):
+        if flag in args:
+            i = args.index(flag)
+            value = cast(args[i + 1])
+            del args[i:i + 2]
+            return value
+        return default
+
+    def flag(name):
+        if name in args:
+            args.remove(name)
+            return True
+        return False
+
+    games = option("--games", GAMES, int)
+    out = option("--out", "equilibrage.csv")
+    policy = option("--policy", "esquive")
+    workers = option("--workers", None, int)
+    max_seconds = option("--max-seconds", MAX_SECONDS, float)
+    sim_hz = option("--sim-hz", FPS, int)
+    seed = option("--seed", SEED, int)
+    game_kwargs = {"endless": flag("--endless"), "vectorized_bullets": flag("--vectorized")}
+    resume = flag("--resume")
+    if policy not in POLICIES:
+        raise SystemExit(f"joueur inconnu : {policy!r} (connus : {', '.join(POLICIES)})")
+    names, points = parse_grid(args)
+    sweep_grid(names, points, out, games, policy, max_seconds, sim_hz, seed, workers, resume,
+               game_kwargs)
+    print(f"Résultats dans {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,123 @@
+# ---------------------------------------------------------------
+# Collisions continues (swept AABB) pour les projectiles rapides
+# ---------------------------------------------------------------
+# groupcollide / spritecollide ne testent que les positions en fin de pas : une balle
+# qui avance de plus que la hauteur d’un ennemi (25 px) en un pas — grand pas de temps
+# en headless, balles plus rapides — peut le traverser sans jamais le chevaucher.
+#
+# Ici chaque projectile est testé sur tout son segment de mouvement du pas :
+#   1. le mouvement est exprimé par rapport à la cible (la flotte et le joueur bougent
+#      aussi) : dans le repère de la cible en fin de pas, la balle va de
+#      prev + déplacement_cible à sa position actuelle ;
+#   2. phase large : le rect qui englobe ce trajet est testé contre la grille de la
+#      flotte (Fleet.collide_rect) ou le rect du joueur ;
+#   3. phase fine : test des "slabs" (intervalles de temps de recouvrement sur x et y),
+#      avec le même recouvrement strict que Rect.colliderect. Une balle touche la
+#      première cible rencontrée sur son trajet ;
+#   4. collisions au pixel près (collider donné) : pendant l’intervalle où les boîtes
+#      se chevauchent, le trajet est échantillonné tous les 1 px au plus et les masques
+#      sont testés à chaque position (mask_time). Une balle qui traverse un coin
+#      transparent de sa cible ne touche pas, quel que soit le pas de simulation.
+import math
+
+import pygame
+
+
+def sweep_interval(x, y, w, h, dx, dy, target):
+    """Intervalle (t0, t1) ⊂ [0, 1] où la boîte (x, y, w, h) déplacée de (dx, dy)
+    chevauche target (strictement, comme colliderect) ; None si jamais pendant le pas."""
+    t_enter, t_exit = -math.inf, math.inf
+    for pos, size, d, lo, hi in ((x, w, dx, target.left, target.right),
+                                 (y, h, dy, target.top, target.bottom)):
+        if d == 0:
+            if not (pos < hi and lo < pos + size):   # immobile et hors de la cible sur cet axe
+                return None
+            continue
+        a, b = (lo - (pos + size)) / d, (hi - pos) / d
+        if a > b:
+            a, b = b, a
+        t_enter = max(t_enter, a)
+        t_exit = min(t_exit, b)
+    if t_enter < t_exit and t_enter < 1 and t_exit > 0:
+        return max(t_enter, 0.0), min(t_exit, 1.0)
+    return None
+
+
+def sweep_time(x, y, w, h, dx, dy, target):
+    """Instant t ∈ [0, 1] où la boîte commence à chevaucher target ; None si jamais."""
+    interval = sweep_interval(x, y, w, h, dx, dy, target)
+    return None if interval is None else interval[0]
+
+
+def mask_time(target, target_mask, mask, x, y, dx, dy, t0, t1):
+    """Premier instant t ∈ [t0, t1] où mask (boîte en (x + t·dx, y + t·dy)) recouvre
+    target_mask (placé en target.topleft) ; None si les pixels ne se touchent pas.
+
+    Le trajet est échantillonné tous les 1 px au plus : aucune position entière n’est
+    sautée, comme si la balle avançait d’un pixel par pas.
+    """
+    steps = max(1, math.ceil(max(abs(dx), abs(dy)) * (t1 - t0)))
+    for i in range(steps + 1):
+        t = t0 + (t1 - t0) * i / steps
+        offset = (round(x + t * dx) - target.x, round(y + t * dy) - target.y)
+        if target_mask.overlap(mask, offset) is not None:
+            return t
+    return None
+
+
+def _path(sprite, delta):
+    """(x0, y0, dx, dy, rect englobant) du trajet de sprite dans le repère de la cible."""
+    rect = sprite.rect
+    x0, y0 = sprite.prev[0] + delta[0], sprite.prev[1] + delta[1]
+    bounds = rect.union(pygame.Rect(x0, y0, rect.width, rect.height))
+    return x0, y0, rect.x - x0, rect.y - y0, bounds
+
+
+def _contact(collider, target, b, x0, y0, dx, dy):
+    """Instant où b touche target sur son trajet : boîtes, puis masques si collider."""
+    interval = sweep_interval(x0, y0, b.rect.width, b.rect.height, dx, dy, target.rect)
+    if interval is None or collider is None:
+        return None if interval is None else interval[0]
+    return collider.sweep(target, b, x0, y0, dx, dy, *interval)
+
+
+def fleet_collide(fleet, bullets, fleet_delta, collider=None):
+    """Équivalent continu de groupcollide(enemies, bullets, True, True) pour la flotte.
+
+    fleet_delta : déplacement (px écran) de la formation pendant le pas.
+    collider    : collide.MaskCollider pour confirmer les contacts au pixel près.
+    Chaque balle détruit le premier ennemi rencontré ; renvoie {ennemi: [balle]}.
+    """
+    hits = {}
+    for b in bullets.sprites():
+        x0, y0, dx, dy, bounds = _path(b, fleet_delta)
+        first, first_t = None, None
+        for e in fleet.collide_rect(bounds):          # grille de la flotte (phase large)
+            t = _contact(collider, e, b, x0, y0, dx, dy)
+            if t is not None and (first_t is None or t < first_t):
+                first, first_t = e, t
+        if first is not None:
+            hits[first] = [b]
+            first.kill()
+            b.kill()
+    return hits
+
+
+def sprite_collide(target, target_prev, bullets, dokill=True, collider=None):
+    """Équivalent continu de spritecollide(target, bullets, dokill) : balles dont le
+    trajet du pas croise target (qui s’est déplacé depuis target_prev).
+
+    collider : collide.MaskCollider pour confirmer les contacts au pixel près.
+    """
+    rect = target.rect
+    delta = (rect.x - target_prev[0], rect.y - target_prev[1])
+    hit = []
+    for b in bullets.sprites():
+        x0, y0, dx, dy, bounds = _path(b, delta)
+        if not bounds.colliderect(rect):              # phase large
+            continue
+        if _contact(collider, target, b, x0, y0, dx, dy) is not None:
+            hit.append(b)
+            if dokill:
+                b.kill()
+    return hit
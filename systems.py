@@ -0,0 +1,61 @@
+# ---------------------------------------------------------------
+# Ordonnanceur des mises à jour : une routine groupée par type d’entité
+# ---------------------------------------------------------------
+# all_sprites.update() appelle update() sur CHAQUE sprite, y compris les ennemis,
+# qui n’ont rien à faire (la flotte les déplace en bloc) : autant d’appels vides
+# par frame qu’il y a d’ennemis. Ici chaque type d’entité qui bouge (joueur, balles,
+# balles ennemies) est enregistré avec une routine qui met à jour tout le groupe
+# d’un coup ; les entités seulement dessinées ne sont jamais visitées.
+#
+#   scheduler.add("bullets", Bullet.update_all, game.bullets)
+#   scheduler.run(dt, game.all_sprites)
+#
+# Les compteurs (stats()) indiquent, par frame, combien d’appels update() un
+# all_sprites.update() aurait faits et combien ont été évités.
+
+
+class UpdateScheduler:
+    """Appelle, dans l’ordre d’ajout, une routine routine(entités, dt) par type d’entité."""
+
+    def __init__(self):
+        self.systems = []          # (nom, routine, entités, dans all_sprites ?)
+        self.frames = 0
+        self.calls = 0             # appels de routines
+        self.visited = 0           # sprites mis à jour
+        self.sprites = 0           # sprites présents dans all_sprites
+        self.naive = 0             # appels update() d’un all_sprites.update()
+
+    def add(self, name, routine, entities, sprites=True):
+        """Enregistre un système ; sprites=False pour un moteur hors all_sprites
+        (ex. EnemyBulletArrays), compté comme un seul appel."""
+        self.systems.append((name, routine, entities, sprites))
+
+    def clear(self):
+        """Oublie les systèmes (nouvelle partie : nouveaux groupes) ; garde les compteurs."""
+        self.systems.clear()
+
+    def run(self, dt, all_sprites=()):
+        """Met à jour tous les systèmes pour un pas de durée dt."""
+        visited = 0
+        total = naive = len(all_sprites)
+        for _name, routine, entities, sprites in self.systems:
+            if sprites:
+                visited += len(entities)
+            else:
+                naive += 1
+            routine(entities, dt)
+        self.frames += 1
+        self.calls += len(self.systems)
+        self.visited += visited
+        self.sprites += total
+        self.naive += naive
+
+    def stats(self):
+        """Moyennes par frame : appels faits, appels évités, sprites jamais visités."""
+        frames = self.frames or 1
+        return {"frames": self.frames,
+                "calls": self.calls / frames,
+                "naive_calls": self.naive / frames,
+                "avoided": (self.naive - self.calls) / frames,
+                "visited": self.visited / frames,
+                "skipped": (self.sprites - self.visited) / frames}
@@ -0,0 +1,10 @@
+# ---------------------------------------------------------------
+# Configuration des tests : jeu sans fenêtre, modules du dépôt importables
+# ---------------------------------------------------------------
+# Lancer : SDL_VIDEODRIVER=dummy python -m pytest -q tests
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")        # aucune fenêtre (CI, SSH)
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,38 @@
+# ---------------------------------------------------------------
+# Collisions au pixel près : même résultat quel que soit le pas de simulation
+# ---------------------------------------------------------------
+import pygame
+import pytest
+
+from bullet_engine import HAS_NUMPY
+from mainwithasset import Game
+
+ENGINES = [False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY,
+                                                             reason="numpy introuvable"))]
+
+
+def _lives_after_bullet(sim_hz, vectorized, column):
+    """Vies du joueur (masque : disque de rayon 20 dans son rect de 60 px) après le passage
+    d’une balle verticale tirée au-dessus de la colonne `column` de son rect."""
+    game = Game(headless=True, seed=1, sim_hz=sim_hz, vectorized_bullets=vectorized,
+                tuning={"fire": 0})
+    disc = pygame.Surface(game.player.rect.size, pygame.SRCALPHA)
+    pygame.draw.circle(disc, (255, 255, 255), disc.get_rect().center, 20)
+    game.player.mask = pygame.mask.from_surface(disc)
+    x = game.player.rect.left + column
+    if vectorized:
+        game.enemy_bullets.spawn(x, 300, 4, 0, 1.2)
+    else:
+        b = game.enemy_bullet_pool.acquire(x, 300, 4, 0, 1.2)
+        game.enemy_bullets.add(b)
+        game.all_sprites.add(b)
+    for _ in range(3 * sim_hz):
+        game.step(0)
+    return game.player.lives
+
+
+@pytest.mark.parametrize("vectorized", ENGINES)
+@pytest.mark.parametrize("column, lost", [(3, 0), (30, 1)], ids=["coin_vide", "centre"])
+def test_swept_collisions_use_masks(vectorized, column, lost):
+    lives = [_lives_after_bullet(hz, vectorized, column) for hz in (60, 20)]  # 20 Hz : swept
+    assert lives == [3 - lost] * 2
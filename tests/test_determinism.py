@@ -0,0 +1,102 @@
+# ---------------------------------------------------------------
+# Déterminisme : replays, instantanés et trajectoires des balles ennemies
+# ---------------------------------------------------------------
+# Une partie headless est entièrement fixée par sa graine, ses options et ses
+# entrées. Ces tests vérifient que les raccourcis de performance (tables de
+# trajectoires, moteur NumPy, pas de simulation larges) ne cassent pas cette
+# propriété : rejouer ou restaurer une partie redonne exactement la même trace.
+import math
+import random
+
+import pygame
+import pytest
+
+import replay
+from bullet_engine import HAS_NUMPY
+from mainwithasset import FPS, HEIGHT, EnemyBullet, Game
+
+STEPS = 600
+
+
+def _actions(seed, n=STEPS):
+    """Entrées pseudo-aléatoires : déplacements, tir, et de temps en temps un redémarrage."""
+    rs = random.Random(seed)
+    return [rs.randrange(8) | (8 if rs.random() < 0.002 else 0) for _ in range(n)]
+
+
+def _bullets(game):
+    """Positions des balles ennemies, quel que soit le moteur."""
+    engine = game.enemy_bullets
+    if game.vectorized_bullets:
+        n = engine.count
+        return sorted(zip(engine.x[:n].tolist(), engine.y[:n].tolist()))
+    return sorted(b.rect.topleft for b in engine)
+
+
+def _trace(game, actions):
+    """Joue les actions ; état observable après chaque pas."""
+    out = []
+    for a in actions:
+        game.step(a)
+        out.append((game.frame, game.state, game.score, game.player.lives,
+                    tuple(game.player.rect), sorted(e.rect.topleft for e in game.enemies),
+                    sorted(b.rect.topleft for b in game.bullets), _bullets(game)))
+    return out
+
+
+def test_record_replay_round_trip(tmp_path):
+    path = tmp_path / "session.sirp"
+    actions = _actions(1, 2000)
+    with replay.Recorder(path, 1234) as rec:
+        game = Game(headless=True, seed=1234, sim_hz=30, spawn_per_frame=4, recorder=rec)
+        for a in actions:
+            rec.record(a)
+            game.step(a)
+
+    seed, options, frames = replay.read_log(path)
+    assert seed == 1234 and list(frames) == actions
+    assert options["sim_hz"] == 30 and options["spawn_per_frame"] == 4
+    assert [len(w["slots"]) for w in options["waves"]] == [len(w) for w in game.waves.waves]
+
+    again, _fps = replay.replay(path)
+    assert again.frame == game.frame
+    assert (again.score, again.player.lives, again.player.rect) == \
+        (game.score, game.player.lives, game.player.rect)
+    assert sorted(e.rect.topleft for e in again.enemies) == \
+        sorted(e.rect.topleft for e in game.enemies)
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    pytest.param({"vectorized_bullets": True},
+                 marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy introuvable")),
+    {"endless": True},
+    {"sim_hz": 20},
+], ids=["sprites", "numpy", "endless", "20hz"])
+def test_snapshot_restore_same_trace(options):
+    game = Game(headless=True, seed=7, **options)
+    _trace(game, _actions(2))                       # partie déjà engagée
+    blob = game.snapshot()
+    actions = _actions(3)
+    first = _trace(game, actions)
+    game.restore(blob)
+    assert _trace(game, actions) == first
+
+
+@pytest.mark.parametrize("dt", [1, 3])
+@pytest.mark.parametrize("drift", [0.0, 0.7])
+def test_enemy_bullet_table_matches_closed_form(dt, drift):
+    amp, freq, phase, speed = 60, 1.2, 0.4, 4
+    spawn_x, spawn_y = 300, 100
+    bullet = EnemyBullet(spawn_x, spawn_y, speed, amp, freq, phase, drift)
+    group = pygame.sprite.Group(bullet)
+    t = 0.0
+    for k in range(1, HEIGHT):
+        EnemyBullet.update_all(group, dt)
+        if not bullet.alive():                       # retirée au pas de sortie prévu
+            break
+        t += dt / FPS                                # même cumul que la balle
+        x = spawn_x + amp * math.sin(phase + 2.0 * math.pi * freq * t) + drift * (t * FPS)
+        assert bullet.rect.centerx == int(x), k
+        assert bullet.rect.y == int(spawn_y + k * (speed * dt)), k
+    assert k == bullet.exit_k and k * speed * dt > HEIGHT - spawn_y
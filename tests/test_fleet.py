@@ -0,0 +1,46 @@
+# ---------------------------------------------------------------
+# Ligne de front de la flotte : seuls les ennemis non masqués tirent
+# ---------------------------------------------------------------
+import random
+
+import pygame
+import pytest
+
+from fleet import Fleet
+from waves import generate_wave
+
+
+def _fleet(wave):
+    fleet = Fleet()
+    for x, y in wave.slots:
+        e = pygame.sprite.Sprite()
+        e.rect = pygame.Rect(x, y, 40, 25)
+        fleet.add(e)
+    return fleet
+
+
+def _blocked(fleet, enemy):
+    """Un ennemi vivant plus bas chevauche-t-il la largeur d’enemy ?"""
+    r = enemy.local_rect
+    return any(o.local_rect.bottom > r.bottom and o.local_rect.left < r.right
+               and r.left < o.local_rect.right for o in fleet if o is not enemy)
+
+
+def test_staggered_rows_only_front_line_fires():
+    rng = random.Random(1)
+    fleet = _fleet(generate_wave(20, rng, 800, 600))        # 165 ennemis, rangées décalées
+    while fleet:
+        front = {fleet.shooter(rng) for _ in range(20)}
+        assert not any(_blocked(fleet, e) for e in front)
+        assert set(fleet._front) == {e for e in fleet if not _blocked(fleet, e)}
+        fleet.remove(rng.choice(list(fleet)))
+    assert fleet.shooter(rng) is None
+
+
+def test_front_order_rejects_other_formation():
+    fleet = _fleet(generate_wave(1, random.Random(2), 800, 600))
+    order = fleet.front_order
+    fleet.front_order = order[::-1]
+    assert fleet.front_order == order[::-1]
+    with pytest.raises(ValueError):
+        fleet.front_order = order[1:]
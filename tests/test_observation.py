@@ -0,0 +1,31 @@
+# ---------------------------------------------------------------
+# Observations : toute la vague est visible, ou l’encodeur refuse
+# ---------------------------------------------------------------
+import pytest
+
+pytest.importorskip("numpy")
+
+from mainwithasset import Game  # noqa: E402
+from observation import HEADER, ObservationEncoder  # noqa: E402
+
+
+def test_default_capacity_covers_every_wave():
+    game = Game(headless=True, seed=1, endless=True, spawn_per_frame=1000)
+    encoder = ObservationEncoder(game)
+    assert encoder.max_enemies == game.waves.capacity() == 165
+    for wave in game.waves.waves:
+        game.start_wave(wave)
+        obs = encoder.array
+        encoder.encode()
+        n = len(wave.slots)
+        assert obs[HEADER:HEADER + encoder.max_enemies].sum() == n
+        slots = obs[HEADER + encoder.max_enemies:].reshape(-1, 2)[:encoder.max_enemies]
+        assert (slots[:n] > 0).all() and not slots[n:].any()
+
+
+def test_wave_larger_than_observation_raises():
+    game = Game(headless=True, seed=1)
+    encoder = ObservationEncoder(game, max_enemies=30)
+    game.start_wave(game.waves.waves[2])             # 96 ennemis
+    with pytest.raises(ValueError):
+        encoder.encode()
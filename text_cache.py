@@ -0,0 +1,48 @@
+# ---------------------------------------------------------------
+# Cache des textes rendus (HUD)
+# ---------------------------------------------------------------
+# font.render() rasterise le texte à chaque appel, alors que le HUD ("Score: 120",
+# "Lives: 3", message de fin) ne change que quelques fois par partie.
+# TextCache garde les surfaces déjà rendues dans un petit cache LRU :
+# un texte n’est rasterisé qu’à sa première apparition (ou après éviction).
+from collections import OrderedDict
+
+
+class TextCache:
+    """Cache LRU de surfaces de texte pour une police donnée."""
+
+    def __init__(self, font, capacity=64):
+        self.font = font
+        self.capacity = capacity            # nombre maximal de surfaces gardées
+        self._surfaces = OrderedDict()      # (texte, antialias, couleur) -> Surface
+        self.hits = 0                       # rendus servis depuis le cache
+        self.misses = 0                     # rendus réellement rasterisés
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, text, antialias, color):
+        """Même signature que font.render(text, antialias, color), mais mise en cache."""
+        key = (text, antialias, color)
+        surfaces = self._surfaces
+        surf = surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            surfaces.move_to_end(key)       # le plus récemment utilisé en dernier
+            return surf
+        self.misses += 1
+        surf = self.font.render(text, antialias, color)
+        surfaces[key] = surf
+        if len(surfaces) > self.capacity:
+            surfaces.popitem(last=False)    # évince le moins récemment utilisé
+        return surf
+
+    def clear(self):
+        """Vide le cache (ex. changement de police)."""
+        self._surfaces.clear()
+
+    def stats(self):
+        """Compteurs du cache : hits, misses, taille et taux de réussite."""
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._surfaces),
+                "hit_rate": self.hits / total if total else 0.0}
@@ -0,0 +1,136 @@
+# ---------------------------------------------------------------
+# Tables de trajectoires précalculées pour les balles ennemies sinusoïdales
+# ---------------------------------------------------------------
+# Une balle ennemie suit x = spawn_x + amp·sin(phase + ω·t) + drift·(t·fps), avec t qui
+# avance d’un pas fixe (dt / fps) à chaque mise à jour. Le décalage horizontal au pas k
+# ne dépend donc que de (amp, freq, phase, drift, dt) : il est calculé UNE fois par
+# combinaison, rangé dans une table partagée, et chaque balle n’a plus qu’à lire
+# table[k] (aucun math.sin par balle et par frame).
+#
+# La table garde aussi le minimum et le maximum cumulés du décalage : le pas où une
+# balle sort de l’écran (par le bas ou sur les côtés) se calcule dès son premier pas,
+# et la balle est retirée à ce pas sans tester ses bords à chaque frame.
+#
+# TrajectoryCache garde les tables dans un cache LRU : les combinaisons rarement
+# utilisées sont évincées (une balle en vol garde sa table jusqu’à sa sortie).
+import math
+from bisect import bisect_left
+from collections import OrderedDict
+
+EPS = 1e-6                 # marge sur les seuils (arrondis flottants), revérifiée exactement
+
+
+class Trajectory:
+    """Décalages horizontaux successifs d’une balle sinusoïdale (table qui s’allonge au besoin)."""
+
+    def __init__(self, amp, freq, phase, drift, step_t, fps):
+        self.amp = amp
+        self.omega = 2.0 * math.pi * freq            # pulsation angulaire (2πf), comme EnemyBullet
+        self.phase = phase
+        self.drift = drift
+        self.step_t = step_t                         # temps simulé par pas (dt / fps)
+        self.fps = fps
+        self.t = 0.0                                 # temps du dernier pas calculé
+        self.sin = []                                # amp·sin(phase + ω·t) au pas k (indice k - 1)
+        self.drift_x = [] if drift else None         # drift·(t·fps) au pas k (si dérive)
+        self._neg_lo = []                            # -(minimum cumulé du décalage), croissant
+        self._hi = []                                # maximum cumulé du décalage, croissant
+
+    def __len__(self):
+        return len(self.sin)
+
+    def extend(self, n):
+        """Calcule les pas jusqu’au n-ième inclus (t cumulé exactement comme une balle)."""
+        sin, amp, omega, phase = math.sin, self.amp, self.omega, self.phase
+        drift, fps, step_t = self.drift, self.fps, self.step_t
+        t = self.t
+        lo = -self._neg_lo[-1] if self._neg_lo else math.inf
+        hi = self._hi[-1] if self._hi else -math.inf
+        for _ in range(n - len(self.sin)):
+            t += step_t
+            s = amp * sin(phase + omega * t)
+            self.sin.append(s)
+            if self.drift_x is not None:
+                d = drift * (t * fps)
+                self.drift_x.append(d)
+                s += d
+            lo = min(lo, s)
+            hi = max(hi, s)
+            self._neg_lo.append(-lo)
+            self._hi.append(hi)
+        self.t = t
+
+    def x(self, spawn_x, k):
+        """Abscisse (flottante) du centre au pas k, identique au calcul direct."""
+        if k > len(self.sin):
+            self.extend(k + 64)
+        if self.drift_x is None:
+            return spawn_x + self.sin[k - 1]
+        return spawn_x + self.sin[k - 1] + self.drift_x[k - 1]
+
+    def exit_step(self, spawn_x, y0, vy, w, width, height, margin=40):
+        """Pas auquel la balle (largeur w, haut en y0 + k·vy) sort de l’écran.
+
+        Même règle que le test de bords d’EnemyBullet : haut > height, ou plus de
+        `margin` px hors de l’écran à gauche / à droite. None si la balle ne descend pas.
+        """
+        if vy <= 0:
+            return None
+        # Sortie par le bas : premier k avec int(y0 + k·vy) > height
+        k_out = max(1, math.ceil((height + 1 - y0) / vy))
+        while k_out > 1 and int(y0 + (k_out - 1) * vy) > height:
+            k_out -= 1
+        while int(y0 + k_out * vy) <= height:
+            k_out += 1
+        if k_out > len(self.sin):
+            self.extend(k_out)
+        # Sortie sur les côtés : seuils sur le centre, puis premier pas candidat trouvé par
+        # dichotomie dans les extrêmes cumulés, confirmé par le calcul exact
+        half = w // 2
+        x_left = -margin - w + half - 1 - spawn_x    # right < -margin  <=>  x <= ce seuil
+        x_right = width + margin + 1 + half - spawn_x  # left > width + margin <=> x >= ce seuil
+        start = min(bisect_left(self._neg_lo, -x_left - EPS, 0, k_out),
+                    bisect_left(self._hi, x_right - EPS, 0, k_out))
+        for k in range(start + 1, k_out):
+            cx = int(self.x(spawn_x, k))
+            left = cx - half
+            if left + w < -margin or left > width + margin:
+                return k
+        return k_out
+
+
+class TrajectoryCache:
+    """Cache LRU de tables de trajectoires, indexé par (amp, freq, phase, drift, dt)."""
+
+    def __init__(self, capacity=32):
+        self.capacity = capacity            # nombre maximal de tables gardées
+        self._tables = OrderedDict()        # (amp, freq, phase, drift, dt, fps) -> Trajectory
+        self.hits = 0                       # tables servies depuis le cache
+        self.misses = 0                     # tables créées
+
+    def __len__(self):
+        return len(self._tables)
+
+    def get(self, amp, freq, phase, drift, dt, fps):
+        """Table partagée pour ces paramètres (créée au premier usage)."""
+        key = (amp, freq, phase, drift, dt, fps)
+        tables = self._tables
+        table = tables.get(key)
+        if table is not None:
+            self.hits += 1
+            tables.move_to_end(key)         # la plus récemment utilisée en dernier
+            return table
+        self.misses += 1
+        table = tables[key] = Trajectory(amp, freq, phase, drift, dt / fps, fps)
+        if len(tables) > self.capacity:
+            tables.popitem(last=False)      # évince la moins récemment utilisée
+        return table
+
+    def clear(self):
+        self._tables.clear()
+
+    def stats(self):
+        """Compteurs du cache : hits, misses, taille et taux de réussite."""
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._tables),
+                "hit_rate": self.hits / total if total else 0.0}
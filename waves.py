@@ -0,0 +1,141 @@
+# ---------------------------------------------------------------
+# Vagues d’ennemis : dispositions décrites dans des fichiers, vagues chaînées
+# ---------------------------------------------------------------
+# Une vague = la liste des emplacements de sa formation + ses réglages (vitesse,
+# descente, cadence de tir). Les dispositions se décrivent dans des fichiers
+# texte compacts (layouts/*.wave) :
+#
+#   # commentaire
+#   speed 1          vitesse horizontale de la flotte (px / frame de référence)
+#   drop 15          descente quand un bord est touché (px)
+#   fire 0.05        probabilité de tir par frame pour 30 ennemis
+#   cell 80 40       taille d’une case de la grille (px)
+#   origin 60 80     coin haut-gauche de la grille à l’écran (px)
+#   XXXXXXXXX        une ligne par rangée : X = ennemi, autre caractère = case vide
+#   .XXXXXXX
+#
+# WaveSequence enchaîne les fichiers dans l’ordre puis, en mode infini, génère des
+# vagues de plus en plus grandes. Les fichiers sont lus une seule fois, à la création
+# de la séquence : en partie, démarrer une vague ne coûte que la création des ennemis,
+# que Game étale sur plusieurs frames (Game.spawn_enemies).
+from pathlib import Path
+
+LAYOUTS = Path(__file__).parent / "layouts"
+# Vagues générées : pas de la grille (ennemis de 40 x 25 px, jamais superposés)
+CELL_X, ROW_MIN = 45, 30
+LOSS_MARGIN = 200          # la formation apparaît au moins à 200 px du bas de l’écran
+MAX_GENERATED = 600        # ennemis demandés au plus pour une vague générée
+ENEMY_CHARS = "Xx#"
+
+
+class Wave:
+    """Une vague : emplacements (x, y) à l’écran au départ et réglages de la flotte."""
+
+    def __init__(self, slots, speed=1, drop=15, fire=0.05, fire_min=0.002, name=""):
+        self.slots = slots            # [(x, y)] coin haut-gauche de chaque ennemi
+        self.speed = speed
+        self.drop = drop
+        self.fire = fire              # probabilité de tir par frame pour 30 ennemis
+        self.fire_min = fire_min      # probabilité minimale (derniers ennemis)
+        self.name = name
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __repr__(self):
+        return f"Wave({self.name!r}, {len(self.slots)} ennemis, speed={self.speed})"
+
+
+def parse_layout(text, name=""):
+    """Construit une Wave à partir du contenu d’un fichier de disposition."""
+    params = {"speed": 1.0, "drop": 15, "fire": 0.05, "fire_min": 0.002}
+    cell, origin = (80, 40), (60, 80)
+    rows = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, *values = stripped.split()
+        if key in params and len(values) == 1:
+            params[key] = float(values[0])
+        elif key == "cell" and len(values) == 2:
+            cell = (int(values[0]), int(values[1]))
+        elif key == "origin" and len(values) == 2:
+            origin = (int(values[0]), int(values[1]))
+        else:
+            rows.append(line.rstrip())
+    slots = [(origin[0] + col * cell[0], origin[1] + row * cell[1])
+             for row, chars in enumerate(rows)
+             for col, char in enumerate(chars) if char in ENEMY_CHARS]
+    if params["speed"].is_integer():
+        params["speed"] = int(params["speed"])    # vitesse entière : positions entières
+    params["drop"] = int(params["drop"])
+    return Wave(slots, name=name, **params)
+
+
+def load_layout(path):
+    """Lit un fichier de disposition (.wave)."""
+    path = Path(path)
+    return parse_layout(path.read_text(encoding="utf-8"), name=path.stem)
+
+
+def _grid(n, width, height):
+    """(ennemis, colonnes, rangées) d’une vague générée de n ennemis demandés."""
+    cols = min(n, (width - 100) // CELL_X)
+    max_rows = max(1, (height - LOSS_MARGIN - 60) // ROW_MIN)
+    rows = min(-(-n // cols), max_rows)
+    return min(n, rows * cols), cols, rows
+
+
+def generate_wave(number, rng, width, height, base=21, growth=40, max_enemies=MAX_GENERATED):
+    """Vague procédurale n° number : plus d’ennemis, plus rapides, qui tirent plus.
+
+    Grille de 45 x (30..40) px, rangées impaires décalées d’une demi-case ; les cases
+    en trop sont vidées au hasard (rng du jeu : même graine => mêmes vagues). Le nombre
+    d’ennemis est plafonné aux rangées qui tiennent sans se chevaucher au-dessus de
+    height - LOSS_MARGIN (au-delà, seules la vitesse et la cadence de tir augmentent).
+    """
+    n, cols, rows = _grid(min(base + growth * number, max_enemies), width, height)
+    dy = max(ROW_MIN, min(40, (height // 2 - 60) // rows))
+    cells = [(40 + col * CELL_X + (22 if row % 2 else 0), 60 + row * dy)
+             for row in range(rows) for col in range(cols)]
+    holes = set(rng.sample(range(len(cells)), len(cells) - n))
+    slots = [cell for k, cell in enumerate(cells) if k not in holes]
+    return Wave(slots, speed=min(3.0, round(1 + 0.1 * number, 2)), drop=15,
+                fire=min(0.15, 0.05 + 0.005 * number), name=f"infinie {number}")
+
+
+class WaveSequence:
+    """Enchaîne les vagues : fichiers de disposition dans l’ordre, puis vagues générées.
+
+    layouts : chemins de fichiers .wave ou objets Wave (défaut : layouts/*.wave triés)
+    endless : après la dernière disposition, génère des vagues sans fin
+    """
+
+    def __init__(self, layouts=None, endless=False, rng=None, width=800, height=600):
+        if layouts is None:
+            layouts = sorted(LAYOUTS.glob("*.wave"))
+        self.waves = [w if isinstance(w, Wave) else load_layout(w) for w in layouts]
+        self.endless = endless
+        self.rng = rng
+        self.width, self.height = width, height
+        self.number = 0                           # numéro de la vague en cours (1, 2, ...)
+
+    def reset(self):
+        self.number = 0
+
+    def capacity(self):
+        """Nombre maximal d’emplacements d’une vague de la séquence (taille des observations)."""
+        sizes = [len(w.slots) for w in self.waves]
+        if self.endless:
+            sizes.append(_grid(MAX_GENERATED, self.width, self.height)[0])
+        return max(sizes, default=0)
+
+    def next(self):
+        """Vague suivante, ou None si la séquence est terminée (victoire)."""
+        self.number += 1
+        if self.number <= len(self.waves):
+            return self.waves[self.number - 1]
+        if self.endless:
+            return generate_wave(self.number, self.rng, self.width, self.height)
+        return None